@@ -21,9 +21,21 @@ import bpy
 import bmesh
 from bpy.props import BoolProperty, CollectionProperty, IntProperty, FloatVectorProperty, StringProperty
 from bpy.types import Menu, PropertyGroup
+from bpy_extras.io_utils import ExportHelper
+from bpy.app.handlers import persistent
 import time
 import datetime
-from mathutils import Vector
+import hashlib
+import re
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import wraps
+from .profiling import profiled, profiler
+from .overlap_index import OriginGrid, bounds_overlap, evaluate_vertex_pairs, transform_bounds, verts_overlap
+
+PERFORMANCE_ROWS = 5
 
 def updateBooleanVisibility(self, context):
     DarrowToggleCutters.execute(self,context)
@@ -75,54 +87,261 @@ def traverse_tree(t):
     for child in t.children:
         yield from traverse_tree(child)
 
-def store_and_execute_states(collection, case=False):
-    coll = bpy.context.scene.collection
-    colls = []
-    states = []
-
-    obj_states = []
-    objs = []
+class VisibilitySnapshot():
+    """View layer state of every layer collection and object, captured in one pass and keyed by pointer.
+
+    Relinking a collection rebuilds its layer collections and object bases, which resets exclude, hiding and
+    selection. restore() walks the rebuilt view layer once and writes back only the values that differ"""
+
+    def __init__(self, view_layer):
+        self.view_layer = view_layer
+        self.collections = dict()  # collection pointer path -> (exclude, hide_viewport)
+        self.objects = dict()      # object pointer -> (hidden, selected)
+        self.active = None
+        self.capture()
+
+    def walk(self):
+        """Yields (pointer path, LayerCollection) for every layer collection below the scene collection"""
+        stack = [((), self.view_layer.layer_collection)]
+        while stack:
+            path, lc = stack.pop()
+            for child in lc.children:
+                child_path = path + (child.collection.as_pointer(),)
+                yield child_path, child
+                stack.append((child_path, child))
+
+    @profiled("VisibilitySnapshot.capture")
+    def capture(self):
+        view_layer = self.view_layer
+        for path, lc in self.walk():
+            self.collections[path] = (lc.exclude, lc.hide_viewport)
+        for ob in view_layer.objects:
+            self.objects[ob.as_pointer()] = (ob.hide_get(view_layer=view_layer), ob.select_get(view_layer=view_layer))
+        self.active = view_layer.objects.active
+        profiler.count(objects=len(self.objects))
+
+    @profiled("VisibilitySnapshot.restore")
+    def restore(self):
+        """Writes back every captured value that has changed. Returns the number of writes"""
+        view_layer = self.view_layer
+        writes = 0
+
+        # Exclusion first, it decides which objects are in the view layer at all
+        for path, lc in self.walk():
+            state = self.collections.get(path)
+            if state is None:
+                continue
+            exclude, hide_viewport = state
+            if lc.exclude != exclude:
+                lc.exclude = exclude
+                writes += 1
+            if lc.hide_viewport != hide_viewport:
+                lc.hide_viewport = hide_viewport
+                writes += 1
+
+        for ob in view_layer.objects:
+            state = self.objects.get(ob.as_pointer())
+            if state is None:
+                continue
+            hidden, selected = state
+            if ob.hide_get(view_layer=view_layer) != hidden:
+                ob.hide_set(hidden, view_layer=view_layer)
+                writes += 1
+            if ob.select_get(view_layer=view_layer) != selected:
+                ob.select_set(selected, view_layer=view_layer)
+                writes += 1
+
+        if view_layer.objects.active != self.active and (self.active is None or view_layer.objects.get(self.active.name) is not None):
+            view_layer.objects.active = self.active
+            writes += 1
+
+        layer_collection_index.invalidate()
+        profiler.count(objects=len(self.objects), bpy_calls=writes)
+        return writes
+
+def sharing_scenes(scenes):
+    """Returns scenes plus every other scene whose collection tree shares a collection with one of them"""
+    sorted_pointers = {scene.as_pointer() for scene in scenes}
+    collections = {coll.as_pointer() for scene in scenes for coll in collection_tree(scene.collection)}
+    result = list(scenes)
+    for scene in bpy.data.scenes:
+        if scene.as_pointer() in sorted_pointers:
+            continue
+        if any(coll.as_pointer() in collections for coll in collection_tree(scene.collection)):
+            result.append(scene)
+    return result
+
+@profiled("store_and_execute_states")
+def store_and_execute_states(scenes, method='Natural', case=False, prop="", objects=False):
+    """Sorts the collections of each scene exactly once, and with objects set the objects inside them too,
+    then restores the view layer state relinking resets. Returns {scene name: [relinks, seconds]}"""
+    # Collections can be shared with scenes that are not being sorted, so their view layers are captured
+    # too before anything is relinked
+    snapshots = {scene.name: [VisibilitySnapshot(view_layer) for view_layer in scene.view_layers] for scene in sharing_scenes(scenes)}
+    keys = collection_sort_keys([scene.collection for scene in scenes], method, case, prop)
+    object_keys = object_sort_keys(scenes, method, case, prop) if objects else None
+    visited = set()
+    object_visited = set()
+    results = dict()
+
+    for scene in scenes:
+        start = time.perf_counter()
+        with profiler.stage(f"sort_collection: {scene.name}"):
+            relinks = sort_collection(scene.collection, keys, visited)
+        if objects:
+            with profiler.stage(f"sort_collection_objects: {scene.name}"):
+                relinks += sort_collection_objects(scene.collection, object_keys, object_visited)
+        results[scene.name] = [relinks, time.perf_counter() - start]
+
+    # Nothing was relinked, so nothing was reset
+    if any(relinks for relinks, seconds in results.values()):
+        for name, scene_snapshots in snapshots.items():
+            start = time.perf_counter()
+            for snapshot in scene_snapshots:
+                snapshot.restore()
+            if name in results:
+                results[name][1] += time.perf_counter() - start
+
+    return results
+
+NATURAL_SPLIT = re.compile(r"(\d+)")
+
+# Collection color tags in outliner order, untagged collections last
+COLOR_TAG_ORDER = ("COLOR_01", "COLOR_02", "COLOR_03", "COLOR_04", "COLOR_05", "COLOR_06", "COLOR_07", "COLOR_08", "NONE")
+
+def natural_key(name, case=False):
+    """Splits digit runs out of a name so "Wall_2" sorts before "Wall_10". Text and numbers alternate, so
+    parts at the same position always compare with the same type. The full name breaks ties like "2" and "02" """
+    if not case:
+        name = name.lower()
+    parts = NATURAL_SPLIT.split(name)
+    return (tuple(int(part) if i % 2 else part for i, part in enumerate(parts)), name)
+
+def name_key(name, method, case=False):
+    if method == 'Name':
+        return (name if case else name.lower(),)
+    return natural_key(name, case)
+
+def property_key(value):
+    """Orders custom property values: numbers, then text, then anything else, then collections without it"""
+    if value is None:
+        return (3, 0, "")
+    if isinstance(value, (bool, int, float)):
+        return (0, float(value), "")
+    if isinstance(value, str):
+        return (1, 0, value.lower())
+    return (2, 0, str(value))
+
+@profiled("collection_sort_keys")
+def collection_sort_keys(roots, method, case=False, prop=""):
+    """Computes the sort key of every collection below roots once, so sorting never normalizes a name twice.
+    Returns {collection pointer: key}"""
+    names = dict()
+    counts = dict()
+    collections = dict()
+
+    def count_objects(c):
+        # Bottom up, so every collection is counted once however deep the tree is
+        pointer = c.as_pointer()
+        if pointer not in counts:
+            collections[pointer] = c
+            names[pointer] = name_key(c.name, method, case)
+            counts[pointer] = len(c.objects) + sum(count_objects(child) for child in c.children)
+        return counts[pointer]
+
+    for root in roots:
+        count_objects(root)
+    profiler.count(objects=len(collections))
+
+    if method == 'Color':
+        order = {tag: index for index, tag in enumerate(COLOR_TAG_ORDER)}
+        return {pointer: (order.get(c.color_tag, len(order)),) + names[pointer] for pointer, c in collections.items()}
+    if method == 'Count':
+        # Largest collections first
+        return {pointer: (-counts[pointer],) + names[pointer] for pointer in collections}
+    if method == 'Property':
+        return {pointer: property_key(c.get(prop) if prop else None) + names[pointer] for pointer, c in collections.items()}
+    return names
+
+@profiled("object_sort_keys")
+def object_sort_keys(scenes, method, case=False, prop=""):
+    """Computes the sort key of every object in scenes once. Objects have no color tag or object count,
+    so those orders fall back to natural name order. Returns {object pointer: key}"""
+    keys = dict()
+    for scene in scenes:
+        for ob in scene.objects:
+            pointer = ob.as_pointer()
+            if pointer not in keys:
+                if method == 'Property':
+                    keys[pointer] = property_key(ob.get(prop) if prop else None) + name_key(ob.name, method, case)
+                else:
+                    keys[pointer] = name_key(ob.name, 'Name' if method == 'Name' else 'Natural', case)
+    profiler.count(objects=len(keys))
+    return keys
+
+def sorted_prefix_length(current, ordered):
+  """Length of the longest prefix of ordered that already appears in current, in the same order"""
+  matched = 0
+  for item in current:
+    if matched < len(ordered) and item == ordered[matched]:
+      matched += 1
+  return matched
+
+def sort_collection(collection, keys, visited=None):
+  """Sorts child collections by the keys from collection_sort_keys, all the way down. link() always appends, so
+  children forming the longest sorted prefix that is already in order stay put and only the rest are relinked.
+  Collections linked in several places are sorted once. Returns the number of relinks"""
+  if visited is None:
+      visited = set()
+  if collection.as_pointer() in visited:
+      return 0
+  visited.add(collection.as_pointer())
 
-    for c in traverse_tree(coll):
-        if c.name in bpy.data.collections:
-                state = get_layer_collection(c).hide_viewport
-                if c.name not in colls:
-                    colls.append(c)
-                    states.append(state)
+  if collection.children is None:
+      return 0
 
-    for col in bpy.data.collections:
-        get_layer_collection(col).hide_viewport = False
+  current = list(collection.children)
+  children = sorted(
+      current,
+      key=lambda c: keys[c.as_pointer()]
+  )
 
-    for x in bpy.context.scene.objects:
-        if x not in obj_states:
-            state = x.visible_get()
-            objs.append(x)
-            obj_states.append(state)
+  keep = sorted_prefix_length(current, children)
+  for child in children[keep:]:
+    collection.children.unlink(child)
+    collection.children.link(child)
+  relinks = len(children) - keep
+  profiler.count(objects=len(children), bpy_calls=relinks * 2)
 
-    sort_collection(bpy.context.scene.collection, False)
+  for child in children:
+    relinks += sort_collection(child, keys, visited)
 
-    for x in range(0,len(colls)):
-        if colls[x] in colls:
-            get_layer_collection(colls[x]).hide_viewport = states[x]
+  return relinks
 
-    for x in range(0,len(objs)):
-        if objs[x] in objs:
-            objs[x].hide_set(not obj_states[x])
+def sort_collection_objects(collection, keys, visited=None):
+  """Sorts the objects of collection and every collection below it by the keys from object_sort_keys. Like
+  sort_collection, only objects outside the longest already sorted prefix are unlinked and linked again.
+  Returns the number of relinks"""
+  if visited is None:
+      visited = set()
+  if collection.as_pointer() in visited:
+      return 0
+  visited.add(collection.as_pointer())
 
-def sort_collection(collection, case=False):
+  current = list(collection.objects)
+  ordered = sorted(current, key=lambda ob: keys[ob.as_pointer()])
 
-  if collection.children is None:
-      return
+  keep = sorted_prefix_length(current, ordered)
+  for ob in ordered[keep:]:
+    collection.objects.unlink(ob)
+    collection.objects.link(ob)
+  relinks = len(ordered) - keep
+  profiler.count(objects=len(ordered), bpy_calls=relinks * 2)
 
-  children = sorted(
-      collection.children,
-      key=lambda c: c.name if case else c.name.lower()
-  )
+  for child in collection.children:
+    relinks += sort_collection_objects(child, keys, visited)
 
-  for child in children:
-    collection.children.unlink(child)
-    collection.children.link(child)
-    sort_collection(child)
+  return relinks
 
 def strip(obj): 
     name = obj.name
@@ -166,36 +385,14 @@ def collapse_pop_up(self, context):
     row = box.row(align=False)
     row.operator('darrow.sort_outliner', icon='SORTALPHA', text = text_2,emboss = False)
 
-def bmesh_copy_from_object(obj, transform=True, triangulate=True, apply_modifiers=False):
-    """Returns a transformed, triangulated copy of the mesh"""
-    assert obj.type == 'MESH'
-
-    if apply_modifiers and obj.modifiers:
-        depsgraph = bpy.context.evaluated_depsgraph_get()
-        obj_eval = obj.evaluated_get(depsgraph)
-        me = obj_eval.to_mesh()
-        bm = bmesh.new()
-        bm.from_mesh(me)
-        obj_eval.to_mesh_clear()
-    else:
-        me = obj.data
-        if obj.mode == 'EDIT':
-            bm_orig = bmesh.from_edit_mesh(me)
-            bm = bm_orig.copy()
-        else:
-            bm = bmesh.new()
-            bm.from_mesh(me)
-
-    if transform:
-        bm.transform(obj.matrix_world)
-
-    if triangulate:
-        bmesh.ops.triangulate(bm, faces=bm.faces)
+VOLUME_EPSILON = 1e-9
 
-    return bm
-
-def hasVolume(obj):
-    bm = bmesh_copy_from_object(obj, apply_modifiers=True)
+def bmesh_has_volume(me, matrix):
+    """Exact check: triangulated bmesh copy measured with calc_volume"""
+    bm = bmesh.new()
+    bm.from_mesh(me)
+    bm.transform(matrix)
+    bmesh.ops.triangulate(bm, faces=bm.faces)
     volume = bm.calc_volume()
     bm.free()
 
@@ -204,62 +401,789 @@ def hasVolume(obj):
     else: 
         return False
 
-def curve_to_mesh(context, curve):
-    deg = context.evaluated_depsgraph_get()
-    me = bpy.data.meshes.new_from_object(curve.evaluated_get(deg), depsgraph=deg)
-    new_obj = bpy.data.objects.new(curve.name + "_tempMesh", me)
-    context.collection.objects.link(new_obj)
-    new_obj.matrix_world = curve.matrix_world
+def fast_has_volume(me, matrix):
+    """Cheap checks on the raw mesh arrays. Returns None when the volume is too close to zero to call"""
+    if len(me.polygons) == 0:
+        return False
 
-    if hasVolume(new_obj):
-        bool = False
-    else:
-        bool =  True
+    matrix = np.array(matrix, dtype=np.float64)
+    co = read_vertex_coords(me).astype(np.float64) @ matrix[:3, :3].T + matrix[:3, 3]
 
-    bpy.ops.object.select_all(action='DESELECT')
-    bpy.data.objects[new_obj.name].select_set(True)
-    bpy.ops.object.delete() 
+    # A bounding box that is flat on any axis cannot hold volume
+    extent = co.max(axis=0) - co.min(axis=0)
+    size = extent.max()
+    if size == 0.0 or extent.min() <= VOLUME_EPSILON * size:
+        return False
 
-    return bool
+    # Signed volume of the loop triangles, the same sum calc_volume makes over a triangulated copy
+    me.calc_loop_triangles()
+    triangles = np.empty(len(me.loop_triangles) * 3, dtype=np.int32)
+    me.loop_triangles.foreach_get("vertices", triangles)
+    v = co[triangles.reshape(-1, 3)]
+    volume = abs(np.einsum('ij,ij->i', v[:, 0], np.cross(v[:, 1], v[:, 2])).sum()) / 6.0
+
+    if volume <= VOLUME_EPSILON * size ** 3:
+        return None
+    return True
+
+def hasVolume(me, matrix, exact=False):
+    """Returns True if the mesh encloses a non-zero volume once transformed by matrix.
+    Tries the bounding box and vectorized signed volume first, falling back to bmesh when unsure"""
+    if not exact:
+        result = fast_has_volume(me, matrix)
+        if result is not None:
+            return result
+
+    return bmesh_has_volume(me, matrix)
+
+def evaluate_zero_volume_curve(context, curve):
+    """Returns True if the evaluated curve has no volume. The evaluated geometry is read in place,
+    so no mesh datablock is created and the selection is left alone"""
+    deg = context.evaluated_depsgraph_get()
+    curve_eval = curve.evaluated_get(deg)
+    me = curve_eval.to_mesh()
+    profiler.count(bpy_calls=2)
 
-def get_layer_collection(collection):
+    try:
+        return me is None or not hasVolume(me, curve.matrix_world, context.scene.exactVolume_Bool)
+    finally:
+        curve_eval.to_mesh_clear()
+
+CURVE_VOLUME_PROP = "_so_zero_volume"
+
+# (property, floats per point) read from spline points, poly and NURBS points carry a w weight
+CURVE_POINT_PROPS = (("co", 4), ("radius", 1), ("tilt", 1))
+BEZIER_POINT_PROPS = (("co", 3), ("handle_left", 3), ("handle_right", 3), ("radius", 1), ("tilt", 1))
+
+def hash_curve_points(digest, data):
+    """Feeds the settings and point positions of every spline of a Curve into digest"""
+    for spline in data.splines:
+        digest.update(repr((spline.type, spline.use_cyclic_u, len(spline.points), len(spline.bezier_points))).encode())
+        for points, props in ((spline.points, CURVE_POINT_PROPS), (spline.bezier_points, BEZIER_POINT_PROPS)):
+            if len(points) == 0:
+                continue
+            for prop, width in props:
+                values = np.empty(len(points) * width, dtype=np.float32)
+                points.foreach_get(prop, values)
+                digest.update(values.tobytes())
+
+def curve_volume_key(curve):
+    """Hashes every input that can decide whether a curve object has volume, including point positions
+    and the shape of the bevel and taper objects. Returns None for curves with modifiers, whose result
+    depends on more than the curve itself, so they are never cached"""
+    if len(curve.modifiers):
+        return None
+
+    data = curve.data
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(repr((
+        bpy.context.scene.exactVolume_Bool,
+        data.dimensions, data.fill_mode, data.bevel_mode, data.bevel_depth,
+        data.bevel_resolution, data.extrude, data.offset, data.bevel_factor_start, data.bevel_factor_end,
+        curve.matrix_world.determinant() == 0.0,
+    )).encode())
+    hash_curve_points(digest, data)
+
+    for helper in (data.bevel_object, data.taper_object):
+        digest.update(b"helper" if helper else b"none")
+        if helper is not None and helper.type == 'CURVE':
+            hash_curve_points(digest, helper.data)
+
+    return digest.hexdigest()
+
+def is_zero_volume_curve(context, curve):
+    """Cached evaluate_zero_volume_curve. The result is stored on the object as a hidden custom
+    property, so it survives saving, and is only recomputed when curve_volume_key changes.
+    Curves with modifiers are evaluated every time"""
+    key = curve_volume_key(curve)
+    if key is None:
+        return evaluate_zero_volume_curve(context, curve)
+
+    stored = curve.get(CURVE_VOLUME_PROP)
+    if isinstance(stored, str):
+        stored_key, sep, flag = stored.rpartition(":")
+        if stored_key == key:
+            return flag == "1"
+
+    zero_volume = evaluate_zero_volume_curve(context, curve)
+
+    # Linked objects are read only, they just miss the cache
+    if curve.library is None:
+        curve[CURVE_VOLUME_PROP] = f"{key}:{int(zero_volume)}"
+
+    return zero_volume
+
+@profiled("snapshot_world_bounds")
+def snapshot_world_bounds(objects):
+    """Returns an (N, 8, 3) array of world space bounding box corners, read with one foreach_get per property"""
+    scene_objects = bpy.context.scene.objects
+    count = len(scene_objects)
+
+    matrices = np.empty(count * 16, dtype=np.float32)
+    corners = np.empty(count * 24, dtype=np.float32)
+    scene_objects.foreach_get("matrix_world", matrices)
+    scene_objects.foreach_get("bound_box", corners)
+    profiler.count(objects=len(objects), bpy_calls=2)
+
+    # foreach_get hands back matrices column by column
+    matrices = matrices.reshape(count, 4, 4).transpose(0, 2, 1)
+    corners = corners.reshape(count, 8, 3)
+
+    scene_index = {obj.name: index for index, obj in enumerate(scene_objects)}
+    rows = np.fromiter((scene_index[obj.name] for obj in objects), dtype=np.int64, count=len(objects))
+
+    return transform_bounds(matrices[rows], corners[rows])
+
+GEOMETRY_CACHE_BUDGET = 256 * 1024 * 1024
+
+def read_vertex_coords(mesh):
+    """Returns every vertex position of the mesh as an (N, 3) array"""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
+
+class GeometryCache():
+    """Keeps each mesh object's sampled world space vertices between overlap searches.
+
+    Entries are keyed by object and mesh datablock pointer. Geometry edits are picked up from the
+    depsgraph through invalidate_mesh(), so a hit only compares matrix_world, vertex count and sample
+    size and never reads the vertices. The least recently used entries are evicted once the estimated
+    memory use goes over the budget."""
+
+    def __init__(self, budget=GEOMETRY_CACHE_BUDGET):
+        self.budget = budget
+        self.entries = OrderedDict()
+        self.by_mesh = dict()  # mesh pointer -> keys of the entries built from it
+        self.size = 0
+        self.max_verts = 0
+        self.mesh_data = dict()
+
+    def begin(self, max_verts):
+        self.max_verts = max_verts
+        self.mesh_data = dict()
+
+    def end(self):
+        # Raw coordinates are only kept for the duration of a search
+        self.mesh_data = dict()
+
+    def clear(self):
+        self.entries.clear()
+        self.by_mesh.clear()
+        self.size = 0
+        self.mesh_data = dict()
+
+    def invalidate_mesh(self, mesh_pointer):
+        """Drops every entry built from a mesh whose geometry has changed"""
+        for key in self.by_mesh.pop(mesh_pointer, ()):
+            if key in self.entries:
+                self.remove(key)
+
+    def read_mesh(self, mesh):
+        """Returns the coordinates of a mesh, read once per search even when shared by many objects"""
+        key = mesh.as_pointer()
+        if key not in self.mesh_data:
+            self.mesh_data[key] = read_vertex_coords(mesh)
+        return self.mesh_data[key]
+
+    def get_entry(self, obj):
+        matrix = obj.matrix_world
+        fingerprint = (len(obj.data.vertices), tuple(v for row in matrix for v in row), self.max_verts)
+        key = (obj.as_pointer(), obj.data.as_pointer())
+
+        entry = self.entries.get(key)
+        if entry is not None and entry["fingerprint"] == fingerprint:
+            self.entries.move_to_end(key)
+            return entry
+
+        if entry is not None:
+            self.remove(key)
+
+        co = self.read_mesh(obj.data)
+        matrix = np.array(matrix, dtype=np.float32)
+        points = co[:self.max_verts] @ matrix[:3, :3].T + matrix[:3, 3]
+        entry = {"fingerprint": fingerprint, "points": points, "size": points.nbytes}
+        self.entries[key] = entry
+        self.by_mesh.setdefault(key[1], set()).add(key)
+        self.size += entry["size"]
+        self.evict()
+        return entry
+
+    def remove(self, key):
+        entry = self.entries.pop(key)
+        self.size -= entry["size"]
+        keys = self.by_mesh.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if len(keys) == 0:
+                del self.by_mesh[key[1]]
+
+    def evict(self):
+        # Always keep the most recent entry, even if it alone is over budget
+        while self.size > self.budget and len(self.entries) > 1:
+            key = next(iter(self.entries))
+            self.remove(key)
+
+    def overlaps(self, obj1, obj2, tolerance):
+        """True if any sampled vertex of one mesh lies within tolerance of a sampled vertex of the other.
+        Uses the same vectorized grid test as the worker threads, so both paths always agree"""
+        return verts_overlap(self.get_entry(obj1)["points"], self.get_entry(obj2)["points"], tolerance)
+
+geometry_cache = GeometryCache()
+
+@persistent
+def track_geometry_updates(scene, depsgraph):
+    """Invalidates cached overlap geometry of every mesh edited since the last update"""
+    if not geometry_cache.entries:
+        return
+
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        datablock = update.id.original
+        if isinstance(datablock, bpy.types.Object) and datablock.type == 'MESH':
+            geometry_cache.invalidate_mesh(datablock.data.as_pointer())
+        elif isinstance(datablock, bpy.types.Mesh):
+            geometry_cache.invalidate_mesh(datablock.as_pointer())
+
+@persistent
+def clear_geometry_cache(dummy):
+    geometry_cache.clear()
+    layer_collection_index.invalidate()
+
+class LayerCollectionIndex():
+    """Maps each Collection to the path of its LayerCollection, one map per view layer.
+
+    Paths of child names are cached instead of LayerCollection references, which Blender frees
+    whenever it resyncs the view layer. Every hit is checked against the collection, and a miss or
+    a stale path rebuilds the map for that view layer once before giving up."""
+
+    def __init__(self):
+        self.paths = dict()
+
+    def invalidate(self):
+        self.paths.clear()
+
+    def build(self, view_layer):
+        paths = dict()
+
+        def scan_children(lc, path):
+            for c in lc.children:
+                child_path = path + (c.name,)
+                paths.setdefault(c.collection.as_pointer(), child_path)
+                scan_children(c, child_path)
+
+        scan_children(view_layer.layer_collection, ())
+        self.paths[view_layer.as_pointer()] = paths
+        return paths
+
+    def resolve(self, view_layer, path):
+        lc = view_layer.layer_collection
+        for name in path:
+            lc = lc.children.get(name)
+            if lc is None:
+                return None
+        return lc
+
+    def get(self, collection, view_layer):
+        pointer = collection.as_pointer()
+        paths = self.paths.get(view_layer.as_pointer())
+
+        if paths is not None and pointer in paths:
+            lc = self.resolve(view_layer, paths[pointer])
+            if lc is not None and lc.collection == collection:
+                return lc
+
+        paths = self.build(view_layer)
+        if pointer not in paths:
+            return None
+        return self.resolve(view_layer, paths[pointer])
+
+layer_collection_index = LayerCollectionIndex()
+
+@persistent
+def invalidate_layer_collections(scene, depsgraph):
+    # Collections linked straight into a scene or a new view layer are picked up by the rebuild on a miss
+    if depsgraph.id_type_updated('COLLECTION'):
+        layer_collection_index.invalidate()
+
+def get_layer_collection(collection, view_layer=None):
     '''Returns the view layer LayerCollection for a specified Collection'''
-    def scan_children(lc, result=None):
-        for c in lc.children:
-            if c.collection == collection:
-                return c
-            result = scan_children(c, result)
-        return result
+    if view_layer is None:
+        view_layer = bpy.context.view_layer
+    return layer_collection_index.get(collection, view_layer)
 
-    return scan_children(bpy.context.view_layer.layer_collection)
+class DeferredUpdates():
+    """Holds back view layer updates during bulk relinks and hides.
 
-def toggleCollectionVis(ob, collectionName, bool, parentCollName = None):
-    if str(ob.users_collection[0].name) == collectionName:
-        """Blender makes things hard and throws an error if you try to directly access a nested collection from the viewlayer. This was a workaround I found online."""
+    Inside deferred(), update() only records the view layer. When the outermost deferred() exits, each
+    recorded view layer is updated once. Outside of it, update() runs straight away"""
 
-        coll = get_layer_collection(bpy.data.collections[collectionName])
-        coll.hide_viewport = bool
-        coll.hide_viewport = not coll.hide_viewport
+    def __init__(self):
+        self.depth = 0
+        self.pending = dict()
+        self.flushes = 0
 
+    def update(self, view_layer):
+        if self.depth:
+            self.pending[view_layer.as_pointer()] = view_layer
+        else:
+            view_layer.update()
+            self.flushes += 1
+            profiler.count(bpy_calls=1)
+
+    @contextmanager
+    def deferred(self):
+        self.depth += 1
+        try:
+            yield self
+        finally:
+            self.depth -= 1
+            if self.depth == 0:
+                self.flush()
+
+    def flush(self):
+        pending = list(self.pending.values())
+        self.pending.clear()
+        for view_layer in pending:
+            view_layer.update()
+        self.flushes += len(pending)
+        profiler.count(bpy_calls=len(pending))
+
+deferred_updates = DeferredUpdates()
+
+def batched_updates(func):
+    """Decorator running an operator's execute with view layer updates deferred to the end. The single
+    undo step comes from the operator's 'UNDO' option, so nothing inside pushes its own"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with deferred_updates.deferred():
+            return func(*args, **kwargs)
+    return wrapper
+
+class VisibilityBatch():
+    """Collects the visibility writes of one toggle and applies each of them once.
+
+    Every target state is recorded as it is worked out, so repeated requests for the same layer collection
+    or object collapse into one entry. apply() skips anything already in the target state and updates each
+    touched view layer a single time at the end"""
+
+    def __init__(self):
+        self.layer_collections = dict()  # LayerCollection pointer -> (LayerCollection, hide)
+        self.collections = dict()        # Collection pointer -> Collection to make visible
+        self.objects = dict()            # (object, view layer) pointers -> (object, view_layer, hide)
+        self.view_layers = dict()
+
+    def hide_layer_collection(self, coll, hide, view_layer):
+        self.layer_collections[coll.as_pointer()] = (coll, hide)
+        self.view_layers[view_layer.as_pointer()] = view_layer
+
+    def show_collection(self, collection):
+        self.collections[collection.as_pointer()] = collection
+
+    def hide_object(self, ob, hide, view_layer):
+        self.objects[(ob.as_pointer(), view_layer.as_pointer())] = (ob, view_layer, hide)
+        self.view_layers[view_layer.as_pointer()] = view_layer
+
+    @profiled("VisibilityBatch.apply")
+    def apply(self):
+        writes = 0
+
+        for coll, hide in self.layer_collections.values():
+            if coll.hide_viewport != hide:
+                coll.hide_viewport = hide
+                writes += 1
+
+        for collection in self.collections.values():
+            if collection.hide_viewport:
+                collection.hide_viewport = False
+                writes += 1
+
+        for ob, view_layer, hide in self.objects.values():
+            try:
+                if ob.hide_get(view_layer=view_layer) != hide:
+                    ob.hide_set(hide, view_layer=view_layer)
+                    writes += 1
+            except RuntimeError:
+                # Object is not in the view layer, skip
+                pass
+
+        if writes:
+            for view_layer in self.view_layers.values():
+                deferred_updates.update(view_layer)
+
+        profiler.count(objects=len(self.objects), bpy_calls=writes)
+        self.__init__()
+        return writes
+
+def toggleCollectionVis(ob, collectionName, bool, parentCollName = None, view_layer = None, batch = None):
+    """Shows or hides an object, and its collection when the object has been sorted into collectionName.
+    Writes are queued on batch when one is given, otherwise they are applied straight away"""
+    if view_layer is None:
+        view_layer = bpy.context.view_layer
+    pending = batch if batch is not None else VisibilityBatch()
+
+    if ob.users_collection and str(ob.users_collection[0].name) == collectionName:
+        """Blender makes things hard and throws an error if you try to directly access a nested collection from the viewlayer. This was a workaround I found online."""
+
+        organizer = bpy.data.collections.get("_SceneOrganizer")
+        coll = get_layer_collection(bpy.data.collections[collectionName], view_layer)
+        organizer_coll = get_layer_collection(organizer, view_layer) if organizer is not None else None
+
+        # Collections left out of this view layer, or a renamed _SceneOrganizer, leave only the object to toggle
+        if coll is not None and organizer_coll is not None:
+            pending.hide_layer_collection(coll, not bool, view_layer)
+
+            # Make sure the parent collection "_SceneOrganizer" is visible
+            pending.hide_layer_collection(organizer_coll, False, view_layer)
+
+            # If additional parent collection, make sure its visible
+            parent = bpy.data.collections.get(parentCollName) if parentCollName != None else None
+            coll2 = get_layer_collection(parent, view_layer) if parent is not None else None
+            if coll2 is not None:
+                pending.hide_layer_collection(coll2, not bool, view_layer)
+                pending.show_collection(parent)
+
+    pending.hide_object(ob, not bool, view_layer)
+
+    if batch is None:
+        pending.apply()
+
+# (collection, view_layer) pointers whose members have been cleared of per object hiding
+fast_vis_groups = set()
+
+@profiled("set_group_visibility")
+def set_group_visibility(collectionNames, bool, view_layer, batch, parentCollName = None):
+    """Fast path for sorted helpers: shows or hides each named collection with a single LayerCollection
+    write instead of visiting its objects. Returns the names that were handled, anything missing from
+    the file or the view layer is left for per object toggling"""
+    handled = set()
+
+    for name in collectionNames:
+        collection = bpy.data.collections.get(name)
+        coll = get_layer_collection(collection, view_layer) if collection is not None else None
+        if coll is None:
+            continue
+
+        key = (collection.as_pointer(), view_layer.as_pointer())
+        if bool and key not in fast_vis_groups:
+            # Members may still be hidden one by one from the per object path, which would keep them hidden
+            for ob in collection.objects:
+                if ob.hide_get(view_layer=view_layer):
+                    batch.hide_object(ob, False, view_layer)
+            fast_vis_groups.add(key)
+
+        batch.hide_layer_collection(coll, not bool, view_layer)
+        profiler.count(objects=len(collection.objects))
+        handled.add(name)
+
+    if handled:
         # Make sure the parent collection "_SceneOrganizer" is visible
-        get_layer_collection(bpy.data.collections["_SceneOrganizer"]).hide_viewport = False
+        organizer = bpy.data.collections.get("_SceneOrganizer")
+        organizer_coll = get_layer_collection(organizer, view_layer) if organizer is not None else None
+        if organizer_coll is not None:
+            batch.hide_layer_collection(organizer_coll, False, view_layer)
 
-        # If additional parent collection, make sure its visible
         if parentCollName != None:
-            coll2 = get_layer_collection(bpy.data.collections[parentCollName])
-
-            coll2.hide_viewport = bool
-            coll2.hide_viewport = not coll2.hide_viewport
-
-            bpy.data.collections[parentCollName].hide_viewport = False
-
+            coll2 = get_layer_collection(bpy.data.collections[parentCollName], view_layer)
+            if coll2 is not None:
+                batch.hide_layer_collection(coll2, not bool, view_layer)
+            batch.show_collection(bpy.data.collections[parentCollName])
+
+    return handled
+
+def helper_kind(obj):
+    """Returns which visibility toggle owns the object, or None"""
+    if obj.type == 'MESH':
+        return "cutter" if obj.display_type == 'BOUNDS' or obj.display_type == 'WIRE' else None
+    if obj.type == 'CURVE':
+        return "curve"
+    if obj.type == 'ARMATURE':
+        return "armature"
+    if obj.type == 'EMPTY' or obj.type == 'LATTICE':
+        return "empty"
+    return None
+
+@persistent
+def clear_visibility_state(dummy):
+    fast_vis_groups.clear()
+
+def in_view_layer(obj, view_layer):
+    """Looks the object itself up in the view layer, a name lookup could find a linked object of the same name.
+    Only meant for the few helpers found through the dependency index"""
     try:
-        ob.hide_set(bool)
-        ob.hide_set(not bool)
+        obj.hide_get(view_layer=view_layer)
     except RuntimeError:
-        # Object is not in the current view layer, skip
-        pass
+        return False
+    return True
+
+def toggle_stragglers(kind, collectionName, bool, view_layer, batch, grouped, accept=None):
+    """Toggles the objects of kind in view_layer one by one, apart from the members of collectionName when
+    set_group_visibility has already toggled it. Only objects accepted by accept() are toggled when it is given.
+    Returns every object of kind counted as toggled, so the hierarchy search can skip them"""
+    inside = {ob.as_pointer() for ob in bpy.data.collections[collectionName].objects} if grouped else ()
+    toggled = set()
+
+    for ob in view_layer.objects:
+        if helper_kind(ob) != kind:
+            continue
+        if ob.as_pointer() in inside:
+            toggled.add(ob)
+        elif accept is None or accept(ob):
+            toggleCollectionVis(ob, collectionName, bool, view_layer=view_layer, batch=batch)
+            toggled.add(ob)
+
+    profiler.count(objects=len(view_layer.objects))
+    return toggled
+
+def toggle_view_layers(context):
+    """Returns the (scene, view_layer) pairs a visibility toggle works on. Only the active view layer,
+    unless toggleAllScenes_Bool is set, in which case every view layer of every scene"""
+    if context.scene.toggleAllScenes_Bool:
+        return [(scene, view_layer) for scene in bpy.data.scenes for view_layer in scene.view_layers]
+    return [(context.scene, context.view_layer)]
+
+def relink_objects(objects, collection, keep=()):
+    """Makes collection the only collection of each object, apart from any in keep, touching only
+    objects that are not already there. Returns (moved, skipped)"""
+    moved = 0
+    skipped = 0
+    calls = 0
+
+    for obj in objects:
+        if obj is None:
+            continue
+
+        users = obj.users_collection
+        stale = [coll for coll in users if coll != collection and coll not in keep]
+        if len(stale) == 0 and collection in users:
+            skipped += 1
+            continue
+
+        for coll in stale:
+            coll.objects.unlink(obj)
+            calls += 1
+        if collection not in users:
+            collection.objects.link(obj)
+            calls += 1
+        moved += 1
+
+    profiler.count(objects=moved + skipped, bpy_calls=calls)
+    return moved, skipped
+
+def collection_tree(collection):
+    """Yields collection and every collection nested below it, each once"""
+    seen = set()
+    stack = [collection]
+    while stack:
+        coll = stack.pop()
+        if coll.as_pointer() in seen:
+            continue
+        seen.add(coll.as_pointer())
+        yield coll
+        stack.extend(coll.children)
+
+class CutterIndex():
+    """Deduplicated boolean cutters found by the last scan, each with the meshes using it.
+
+    Cutters given as a collection operand are indexed too. Their operand collections and every
+    collection nested in them are remembered, so relinking to _Cutters never pulls a cutter out
+    of the tree a boolean reads."""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.cutters = dict()  # cutter -> consumer meshes, in the order they were found
+        self.operand_collections = set()
+
+    def add(self, obj):
+        for mod in obj.modifiers:
+            if mod.type != 'BOOLEAN':
+                continue
+
+            if getattr(mod, "operand_type", 'OBJECT') == 'COLLECTION':
+                if mod.collection is None:
+                    continue
+                self.operand_collections.update(collection_tree(mod.collection))
+                operands = mod.collection.all_objects
+            elif mod.object is not None:
+                operands = (mod.object,)
+            else:
+                continue
+
+            for cutter in operands:
+                consumers = self.cutters.setdefault(cutter, [])
+                if obj not in consumers:
+                    consumers.append(obj)
+
+        if obj.display_type == 'BOUNDS':
+            self.cutters.setdefault(obj, [])
+
+    @profiled("CutterIndex.scan")
+    def scan(self, objects):
+        self.clear()
+        for obj in objects:
+            self.add(obj)
+        profiler.count(objects=len(objects))
+        return self
+
+    def consumers(self, cutter):
+        """Meshes whose boolean modifiers use cutter"""
+        return self.cutters.get(cutter, [])
+
+    def keep_collections(self):
+        return self.operand_collections
+
+    def consumer_count(self):
+        return len({obj for consumers in self.cutters.values() for obj in consumers})
+
+cutter_index = CutterIndex()
+
+# Modifier properties that can point at another object
+MODIFIER_REFERENCE_ATTRS = ("object", "curve", "offset_object", "target", "mirror_object", "start_cap", "end_cap",
+                            "texture_coords_object", "origin", "object_from", "object_to")
+
+def pointer_of(data):
+    return data.as_pointer() if data is not None else None
+
+class DependencyIndex():
+    """Reverse index from helper objects to the objects referencing them through modifiers, constraints or parenting.
+
+    Built on first use and kept current from depsgraph updates, so hierarchy searches are a lookup instead of a
+    scan over every modifier in the file. Objects are keyed by pointer, so renames keep their entries, and the
+    index is cleared on load, undo and redo, where Blender reallocates them. Helpers and owners that have been
+    removed are pruned when a query reaches them."""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.built = False
+        self.users = dict()       # helper pointer -> (helper, {owner pointer: (owner, [relations])})
+        self.references = dict()  # owner pointer -> set of helper pointers
+        self.transform_keys = dict()  # owner pointer -> transform_key() when last indexed
+
+    def relations(self, obj):
+        """Yields (helper, relation) for everything the object references. A relation is (kind, type, slot, operation)"""
+        for mod in obj.modifiers:
+            for attr in MODIFIER_REFERENCE_ATTRS:
+                helper = getattr(mod, attr, None)
+                if isinstance(helper, bpy.types.Object):
+                    yield helper, ("MODIFIER", mod.type, attr, getattr(mod, "operation", None))
+
+        for con in obj.constraints:
+            helper = getattr(con, "target", None)
+            if isinstance(helper, bpy.types.Object):
+                yield helper, ("CONSTRAINT", con.type, "target", None)
+
+        if obj.parent is not None:
+            yield obj.parent, ("PARENT", obj.parent_type, "parent", None)
+
+    def transform_key(self, obj):
+        """The references that can change with only the transform tagged: constraint targets and the parent"""
+        targets = tuple((con.type, pointer_of(getattr(con, "target", None))) for con in obj.constraints)
+        return (pointer_of(obj.parent), obj.parent_type, targets)
+
+    def remove_owner(self, pointer):
+        self.transform_keys.pop(pointer, None)
+        for helper_pointer in self.references.pop(pointer, ()):
+            entry = self.users.get(helper_pointer)
+            if entry is not None:
+                entry[1].pop(pointer, None)
+                if len(entry[1]) == 0:
+                    del self.users[helper_pointer]
+
+    def update_object(self, obj):
+        pointer = obj.as_pointer()
+        self.remove_owner(pointer)
+        for helper, relation in self.relations(obj):
+            helper_pointer = helper.as_pointer()
+            owners = self.users.setdefault(helper_pointer, (helper, dict()))[1]
+            owners.setdefault(pointer, (obj, []))[1].append(relation)
+            self.references.setdefault(pointer, set()).add(helper_pointer)
+        self.transform_keys[pointer] = self.transform_key(obj)
+
+    def needs_update(self, obj, transform_only):
+        """New objects always need indexing. A transform only update matters when a constraint or the parent changed"""
+        known = self.transform_keys.get(obj.as_pointer())
+        if known is None or not transform_only:
+            return True
+        return known != self.transform_key(obj)
+
+    @profiled("DependencyIndex.build")
+    def build(self):
+        self.clear()
+        for obj in bpy.data.objects:
+            self.update_object(obj)
+        self.built = True
+        profiler.count(objects=len(bpy.data.objects))
+
+    def find_helpers(self, types=None, relation=None):
+        """Returns the referenced helpers of the given object types, optionally only those with a relation accepted by relation()"""
+        if not self.built:
+            self.build()
+
+        helpers = []
+        for helper_pointer, (helper, owners) in list(self.users.items()):
+            try:
+                helper_type = helper.type
+            except ReferenceError:
+                del self.users[helper_pointer]
+                continue
+            if types is not None and helper_type not in types:
+                continue
+
+            live = []
+            for owner_pointer, (owner, relations) in list(owners.items()):
+                try:
+                    owner.name
+                except ReferenceError:
+                    self.remove_owner(owner_pointer)
+                    continue
+                live.extend(relations)
+
+            if live and (relation is None or any(relation(r) for r in live)):
+                helpers.append(helper)
+        return helpers
+
+dependency_index = DependencyIndex()
+
+def is_difference_boolean(relation):
+    kind, mod_type, slot, operation = relation
+    return kind == "MODIFIER" and mod_type == 'BOOLEAN' and operation == 'DIFFERENCE'
+
+@persistent
+def track_dependency_updates(scene, depsgraph):
+    if not dependency_index.built:
+        return
+
+    for update in depsgraph.updates:
+        if not isinstance(update.id, bpy.types.Object):
+            continue
+        obj = update.id.original
+        # Constraint edits and parenting only tag the transform, so those updates compare constraints and parent
+        transform_only = update.is_updated_transform and not update.is_updated_geometry
+        if dependency_index.needs_update(obj, transform_only):
+            dependency_index.update_object(obj)
+
+@persistent
+def clear_dependency_index(dummy):
+    dependency_index.clear()
+
+def toggleHierarchyVis(obj, collectionName, bool, view_layer, batch, grouped = False):
+    """Toggles a helper found through the dependency index, going through its collection when it has been sorted.
+    The index covers the whole file, so helpers outside view_layer are skipped. With grouped set, the collection
+    has already been toggled by set_group_visibility"""
+    if not in_view_layer(obj, view_layer):
+        return
+
+    if obj.users_collection and str(obj.users_collection[0].name) == collectionName:
+        if not grouped:
+            toggleCollectionVis(obj, collectionName, bool, view_layer=view_layer, batch=batch)
+    else:
+        batch.hide_object(obj, not bool, view_layer)
 
+@profiled("MakeCollections")
 def MakeCollections(name, color, bool):
     collectionFound = False
 
@@ -277,6 +1201,7 @@ def MakeCollections(name, color, bool):
     bpy.data.collections[master_collection.name].color_tag = 'COLOR_05'
     bpy.data.collections[new_collection.name].color_tag = color
     master_collection.children.link(new_collection)
+    layer_collection_index.invalidate()
 
     get_layer_collection(new_collection).hide_viewport = not bool
 
@@ -418,13 +1343,41 @@ class DARROW_PT_organizePanel(DarrowOrganizePanel, bpy.types.Panel):
             col.label(text="Overlap Sorting")
             col.prop(context.scene, "overlapSortMethod", text="")
             col.prop(context.scene, "maxSearchVerts", text="Vertex Search Depth", slider = True)
+            col.prop(context.scene, "overlapWorkers", text="Worker Threads")
             col.prop(context.scene,'excludeOverlapSort', text ="Disable Overlap in Sort All", toggle = True)
+            col.prop(context.scene,'liveOverlap_Bool', text ="Live Overlap Updates", toggle = True)
             col.separator()
             col.prop(context.scene, "volumeCurves_Bool", text="Disable Zero-Volume Checking", invert_checkbox = True ,toggle = True)
+            col.prop(context.scene, "exactVolume_Bool", text="Exact Volume Checking", toggle = True)
             col.prop(context.scene,'iconOnly_Bool', text ="Disable Button Text in Outliner", toggle = True)
             col.separator()
             col.label(text="Visibility Toggle Options")
             col.prop(context.scene, 'hierarchySearch_Bool', text="Include Hierarchy Searching", toggle=True)
+            col.prop(context.scene, 'toggleAllScenes_Bool', text="Toggle in All Scenes", toggle=True)
+            col.separator()
+            col.label(text="Outliner Sorting")
+            col.prop(context.scene, "outlinerSortMethod", text="")
+            if context.scene.outlinerSortMethod == 'Property':
+                col.prop(context.scene, "outlinerSortProperty", text="Property")
+            col.prop(context.scene, 'sortObjects_Bool', text="Sort Objects in Collections", toggle=True)
+            col.prop(context.scene, 'sortActiveScene_Bool', text="Sort Active Scene Only", toggle=True)
+
+            box = layout.box()
+            col = box.column(align=True)
+            col.label(text="Performance")
+            if len(profiler.records) == 0:
+                col.label(text="Run a tool to record timings", icon='INFO')
+            else:
+                latest = profiler.records[-1]
+                for record in list(profiler.records)[-PERFORMANCE_ROWS:][::-1]:
+                    col.label(text=f"{record.name}: {record.duration * 1000:.1f} ms, {record.objects} objects, {record.bpy_calls} calls")
+                col.separator()
+                col.label(text=f"Stages of {latest.name}")
+                for child in latest.children.values():
+                    col.label(text=f"  {child.name} x{child.calls}: {child.duration * 1000:.1f} ms, {child.objects} objects")
+            row = col.row(align=True)
+            row.operator("organizer.export_performance", text="Export", icon='EXPORT')
+            row.operator("organizer.clear_performance", text="", icon='TRASH')
             
 class ORGANIZER_OT_Dummy(bpy.types.Operator):
     bl_idname = "organizer.dummy"
@@ -439,6 +1392,30 @@ class ORGANIZER_OT_Dummy(bpy.types.Operator):
     def execute(self, context):
         return {'FINISHED'}
 
+class ORGANIZER_OT_ExportPerformance(bpy.types.Operator, ExportHelper):
+    bl_idname = "organizer.export_performance"
+    bl_label = "Export Performance Log"
+    bl_description = "Write the recorded tool timings to a JSON file"
+    bl_options = {"REGISTER"}
+
+    filename_ext = ".json"
+    filter_glob: StringProperty(default="*.json", options={'HIDDEN'})
+
+    def execute(self, context):
+        profiler.export(self.filepath)
+        self.report({'INFO'}, f"Exported {len(profiler.records)} records")
+        return {'FINISHED'}
+
+class ORGANIZER_OT_ClearPerformance(bpy.types.Operator):
+    bl_idname = "organizer.clear_performance"
+    bl_label = "Clear Performance Log"
+    bl_description = "Clear the recorded tool timings"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        profiler.clear()
+        return {'FINISHED'}
+
 class ORGANIZER_OT_StorePosition(bpy.types.Operator):
     bl_idname = "organizer.store_position"
     bl_label = "Store Position"
@@ -520,10 +1497,16 @@ class DarrowSort(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     bl_description = "Sort Outliner"
 
+    @profiled("darrow.sort_outliner")
     def execute(self,context):
         case_sensitive = False
-        for scene in bpy.data.scenes:
-            store_and_execute_states(scene.collection, case_sensitive)
+        scenes = [context.scene] if context.scene.sortActiveScene_Bool else list(bpy.data.scenes)
+        results = store_and_execute_states(scenes, context.scene.outlinerSortMethod, case_sensitive,
+                                           context.scene.outlinerSortProperty, context.scene.sortObjects_Bool)
+
+        relinks = sum(relinks for relinks, seconds in results.values())
+        timings = ", ".join(f"{name}: {seconds * 1000:.1f} ms" for name, (relinks, seconds) in results.items())
+        self.report({'INFO'}, f"Sorted {len(results)} scenes with {relinks} relinks ({timings})")
         return {'FINISHED'}
 
 class DarrowRenameSelectedHigh(bpy.types.Operator):
@@ -532,6 +1515,7 @@ class DarrowRenameSelectedHigh(bpy.types.Operator):
     bl_description = "Rename selected as high"
     bl_options = {'UNDO'}
 
+    @profiled("darrow.rename_high")
     def execute(self,context):
         objs = bpy.context.selected_objects
         for obj in objs:
@@ -544,6 +1528,7 @@ class DarrowRenameSelectedLow(bpy.types.Operator):
     bl_description = "Rename selected as low"
     bl_options = {'UNDO'}
 
+    @profiled("darrow.rename_low")
     def execute(self,context):
         objs = bpy.context.selected_objects
         for obj in objs:
@@ -556,6 +1541,7 @@ class DarrowCleanName(bpy.types.Operator):
     bl_description = "Replace '.' with '_', and high/low"
     bl_options = {'UNDO'}
 
+    @profiled("darrow.rename_clean")
     def execute(self,context):
         objs = bpy.context.selected_objects
         for obj in objs:
@@ -568,6 +1554,7 @@ class DarrowClearAnnotate(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     bl_description = "Clear ALL annotations"
 
+    @profiled("darrow.clear_annotations")
     def execute(self, context):
         bpy.ops.wm.tool_set_by_id(name="builtin.select_box")
 
@@ -583,40 +1570,29 @@ class DarrowToggleCutters(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     bl_description = "Toggle the visibility of cutters."
 
+    @profiled("darrow.toggle_cutters")
+    @batched_updates
     def execute(self, context):
-        bpy.context.scene.cutterVis_Bool = not bpy.context.scene.cutterVis_Bool
-        
-        # Track objects we've already toggled to avoid duplicates
-        toggled_objects = set()
-
-        # Toggle cutters in the _Cutters collection
-        for ob in bpy.data.objects:
-            if ob.type == 'MESH':
-                if ob.display_type == 'BOUNDS' or ob.display_type == 'WIRE':
-                    toggleCollectionVis(ob, "_Cutters", bpy.context.scene.cutterVis_Bool)
-                    toggled_objects.add(ob.name)
-        
-        # If hierarchy search is enabled, search through all boolean modifiers
-        if bpy.context.scene.hierarchySearch_Bool:
-            for ob in bpy.data.objects:
-                if ob.type == 'MESH':
-                    for mod in ob.modifiers:
-                        if mod.type == 'BOOLEAN' and mod.operation == 'DIFFERENCE':
-                            if mod.object and mod.object.name not in toggled_objects:
-                                cutter_obj = mod.object
-                                # Check if it's in the _Cutters collection for proper toggle
-                                if cutter_obj.users_collection and str(cutter_obj.users_collection[0].name) == "_Cutters":
-                                    toggleCollectionVis(cutter_obj, "_Cutters", bpy.context.scene.cutterVis_Bool)
-                                else:
-                                    # Just toggle visibility directly if not in collection
-                                    try:
-                                        cutter_obj.hide_set(bpy.context.scene.cutterVis_Bool)
-                                        cutter_obj.hide_set(not bpy.context.scene.cutterVis_Bool)
-                                    except RuntimeError:
-                                        # Object is not in the current view layer, skip
-                                        pass
-                                toggled_objects.add(cutter_obj.name)
+        vis = not context.scene.cutterVis_Bool
+        batch = VisibilityBatch()
+        helpers = dependency_index.find_helpers(relation=is_difference_boolean) if context.scene.hierarchySearch_Bool else []
 
+        for scene, view_layer in toggle_view_layers(context):
+            scene.cutterVis_Bool = vis
+
+            # Sorted cutters are toggled through the _Cutters collection, only stragglers are visited one by one
+            grouped = "_Cutters" in set_group_visibility(["_Cutters"], vis, view_layer, batch)
+
+            # Track objects we've already toggled to avoid duplicates
+            toggled_objects = toggle_stragglers("cutter", "_Cutters", vis, view_layer, batch, grouped)
+
+            # If hierarchy search is enabled, also toggle everything used by a difference boolean
+            for cutter_obj in helpers:
+                if cutter_obj not in toggled_objects:
+                    toggleHierarchyVis(cutter_obj, "_Cutters", vis, view_layer, batch, grouped)
+                    toggled_objects.add(cutter_obj)
+
+        batch.apply()
         return {'FINISHED'}
 
 class DarrowToggleOverlap(bpy.types.Operator):
@@ -625,13 +1601,28 @@ class DarrowToggleOverlap(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     bl_description = "Toggle the visibility of curves."
 
+    @profiled("darrow.toggle_overlap")
+    @batched_updates
     def execute(self, context):
-        bpy.context.scene.overlapVis_Bool = not bpy.context.scene.overlapVis_Bool
-
-        for ob in bpy.data.objects:
-            if "Match: " in ob.users_collection[0].name:
-                toggleCollectionVis(ob, ob.users_collection[0].name, bpy.context.scene.overlapVis_Bool, parentCollName="_Overlapping")
+        vis = not context.scene.overlapVis_Bool
+        batch = VisibilityBatch()
+
+        for scene, view_layer in toggle_view_layers(context):
+            scene.overlapVis_Bool = vis
+
+            # Every match group under _Overlapping is toggled through its collection
+            overlap_collection = bpy.data.collections.get("_Overlapping")
+            match_names = [child.name for child in overlap_collection.children if child.name.startswith("Match: ")] if overlap_collection else []
+            grouped = set_group_visibility(match_names, vis, view_layer, batch, parentCollName="_Overlapping")
+
+            # Match groups that could not be toggled as a whole are visited one by one
+            for collection in bpy.data.collections:
+                if "Match: " in collection.name and collection.name not in grouped:
+                    # Members outside view_layer are skipped when the batch is applied
+                    for ob in collection.objects:
+                        toggleCollectionVis(ob, collection.name, vis, parentCollName="_Overlapping", view_layer=view_layer, batch=batch)
                    
+        batch.apply()
         return {'FINISHED'}
 
 class DarrowToggleCurves(bpy.types.Operator):
@@ -640,47 +1631,30 @@ class DarrowToggleCurves(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     bl_description = "Toggle the visibility of curves."
 
+    @profiled("darrow.toggle_curves")
+    @batched_updates
     def execute(self, context):
-        bpy.context.scene.curveVis_Bool = not bpy.context.scene.curveVis_Bool
-        
-        # Track objects we've already toggled to avoid duplicates
-        toggled_objects = set()
+        vis = not context.scene.curveVis_Bool
+        batch = VisibilityBatch()
+        helpers = dependency_index.find_helpers(types={'CURVE'}) if context.scene.hierarchySearch_Bool else []
 
-        for ob in bpy.data.objects:
-            if ob.type == 'CURVE':
-                if bpy.context.scene.volumeCurves_Bool == True:
-                    if curve_to_mesh(context, ob):
-                        toggleCollectionVis(ob, "_Curves", bpy.context.scene.curveVis_Bool)
-                        toggled_objects.add(ob.name)
-                else:
-                    toggleCollectionVis(ob, "_Curves", bpy.context.scene.curveVis_Bool)
-                    toggled_objects.add(ob.name)
-        
-        # If hierarchy search is enabled, search through all modifiers that use curves
-        if bpy.context.scene.hierarchySearch_Bool:
-            for ob in bpy.data.objects:
-                if ob.type == 'MESH':
-                    for mod in ob.modifiers:
-                        curve_obj = None
-                        # Check modifier types that use curve objects
-                        if mod.type == 'CURVE' and hasattr(mod, 'object') and mod.object:
-                            curve_obj = mod.object
-                        elif mod.type == 'ARRAY' and hasattr(mod, 'curve') and mod.curve:
-                            curve_obj = mod.curve
-                        elif hasattr(mod, 'object') and mod.object and mod.object.type == 'CURVE':
-                            curve_obj = mod.object
-                        
-                        if curve_obj and curve_obj.name not in toggled_objects and curve_obj.type == 'CURVE':
-                            if curve_obj.users_collection and str(curve_obj.users_collection[0].name) == "_Curves":
-                                toggleCollectionVis(curve_obj, "_Curves", bpy.context.scene.curveVis_Bool)
-                            else:
-                                try:
-                                    curve_obj.hide_set(bpy.context.scene.curveVis_Bool)
-                                    curve_obj.hide_set(not bpy.context.scene.curveVis_Bool)
-                                except RuntimeError:
-                                    pass
-                            toggled_objects.add(curve_obj.name)
+        for scene, view_layer in toggle_view_layers(context):
+            scene.curveVis_Bool = vis
+
+            # Sorted curves are toggled through the _Curves collection, only stragglers are visited one by one
+            grouped = "_Curves" in set_group_visibility(["_Curves"], vis, view_layer, batch)
+
+            # Track objects we've already toggled to avoid duplicates
+            accept = (lambda ob: is_zero_volume_curve(context, ob)) if context.scene.volumeCurves_Bool == True else None
+            toggled_objects = toggle_stragglers("curve", "_Curves", vis, view_layer, batch, grouped, accept)
+
+            # If hierarchy search is enabled, also toggle every curve another object depends on
+            for curve_obj in helpers:
+                if curve_obj not in toggled_objects:
+                    toggleHierarchyVis(curve_obj, "_Curves", vis, view_layer, batch, grouped)
+                    toggled_objects.add(curve_obj)
                    
+        batch.apply()
         return {'FINISHED'}
 
 class DarrowToggleArms(bpy.types.Operator):
@@ -689,35 +1663,29 @@ class DarrowToggleArms(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     bl_description = "Toggle the visibility of armatures."
 
+    @profiled("darrow.toggle_arms")
+    @batched_updates
     def execute(self, context):
-        bpy.context.scene.armsVis_Bool = not bpy.context.scene.armsVis_Bool
-        
-        # Track objects we've already toggled to avoid duplicates
-        toggled_objects = set()
+        vis = not context.scene.armsVis_Bool
+        batch = VisibilityBatch()
+        helpers = dependency_index.find_helpers(types={'ARMATURE'}) if context.scene.hierarchySearch_Bool else []
 
-        for ob in bpy.data.objects:
-            if ob.type == 'ARMATURE':
-                toggleCollectionVis(ob, "_Armatures", bpy.context.scene.armsVis_Bool)
-                toggled_objects.add(ob.name)
-        
-        # If hierarchy search is enabled, search through all modifiers that use armatures
-        if bpy.context.scene.hierarchySearch_Bool:
-            for ob in bpy.data.objects:
-                if ob.type == 'MESH':
-                    for mod in ob.modifiers:
-                        if mod.type == 'ARMATURE' and hasattr(mod, 'object') and mod.object:
-                            arm_obj = mod.object
-                            if arm_obj and arm_obj.name not in toggled_objects and arm_obj.type == 'ARMATURE':
-                                if arm_obj.users_collection and str(arm_obj.users_collection[0].name) == "_Armatures":
-                                    toggleCollectionVis(arm_obj, "_Armatures", bpy.context.scene.armsVis_Bool)
-                                else:
-                                    try:
-                                        arm_obj.hide_set(bpy.context.scene.armsVis_Bool)
-                                        arm_obj.hide_set(not bpy.context.scene.armsVis_Bool)
-                                    except RuntimeError:
-                                        pass
-                                toggled_objects.add(arm_obj.name)
+        for scene, view_layer in toggle_view_layers(context):
+            scene.armsVis_Bool = vis
+
+            # Sorted armatures are toggled through the _Armatures collection, only stragglers are visited one by one
+            grouped = "_Armatures" in set_group_visibility(["_Armatures"], vis, view_layer, batch)
+
+            # Track objects we've already toggled to avoid duplicates
+            toggled_objects = toggle_stragglers("armature", "_Armatures", vis, view_layer, batch, grouped)
+
+            # If hierarchy search is enabled, also toggle every armature another object depends on
+            for arm_obj in helpers:
+                if arm_obj not in toggled_objects:
+                    toggleHierarchyVis(arm_obj, "_Armatures", vis, view_layer, batch, grouped)
+                    toggled_objects.add(arm_obj)
                 
+        batch.apply()
         return {'FINISHED'}
 
 class DarrowToggleEmpty(bpy.types.Operator):
@@ -726,52 +1694,37 @@ class DarrowToggleEmpty(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     bl_description = "Toggle the visibility of empties"
 
+    @profiled("darrow.toggle_empty")
+    @batched_updates
     def execute(self, context):
-        bpy.context.scene.emptyVis_Bool = not bpy.context.scene.emptyVis_Bool
-        
-        # Track objects we've already toggled to avoid duplicates
-        toggled_objects = set()
+        vis = not context.scene.emptyVis_Bool
+        batch = VisibilityBatch()
+        helpers = dependency_index.find_helpers(types={'EMPTY', 'LATTICE'}) if context.scene.hierarchySearch_Bool else []
 
-        for ob in bpy.data.objects:
-            if ob.type == 'EMPTY' or ob.type == "LATTICE":
-                toggleCollectionVis(ob, "_Empties", bpy.context.scene.emptyVis_Bool)
-                toggled_objects.add(ob.name)
-        
-        # If hierarchy search is enabled, search through all modifiers that use empties
-        if bpy.context.scene.hierarchySearch_Bool:
-            for ob in bpy.data.objects:
-                if ob.type == 'MESH':
-                    for mod in ob.modifiers:
-                        empty_obj = None
-                        # Check various modifier types that use empty/object references
-                        if mod.type == 'ARRAY' and hasattr(mod, 'offset_object') and mod.offset_object:
-                            empty_obj = mod.offset_object
-                        elif mod.type == 'HOOK' and hasattr(mod, 'object') and mod.object:
-                            empty_obj = mod.object
-                        elif mod.type == 'SHRINKWRAP' and hasattr(mod, 'target') and mod.target:
-                            empty_obj = mod.target
-                        elif mod.type == 'CURVE' and hasattr(mod, 'object') and mod.object:
-                            empty_obj = mod.object
-                        elif hasattr(mod, 'object') and mod.object and mod.object.type == 'EMPTY':
-                            empty_obj = mod.object
-                        
-                        if empty_obj and empty_obj.name not in toggled_objects:
-                            if empty_obj.type == 'EMPTY' or empty_obj.type == 'LATTICE':
-                                if empty_obj.users_collection and str(empty_obj.users_collection[0].name) == "_Empties":
-                                    toggleCollectionVis(empty_obj, "_Empties", bpy.context.scene.emptyVis_Bool)
-                                else:
-                                    try:
-                                        empty_obj.hide_set(bpy.context.scene.emptyVis_Bool)
-                                        empty_obj.hide_set(not bpy.context.scene.emptyVis_Bool)
-                                    except RuntimeError:
-                                        pass
-                                toggled_objects.add(empty_obj.name)
+        for scene, view_layer in toggle_view_layers(context):
+            scene.emptyVis_Bool = vis
+
+            # Sorted empties are toggled through the _Empties collection, only stragglers are visited one by one
+            grouped = "_Empties" in set_group_visibility(["_Empties"], vis, view_layer, batch)
+
+            # Track objects we've already toggled to avoid duplicates
+            toggled_objects = toggle_stragglers("empty", "_Empties", vis, view_layer, batch, grouped)
+
+            # If hierarchy search is enabled, also toggle every empty or lattice another object depends on
+            for empty_obj in helpers:
+                if empty_obj not in toggled_objects:
+                    toggleHierarchyVis(empty_obj, "_Empties", vis, view_layer, batch, grouped)
+                    toggled_objects.add(empty_obj)
+
+        batch.apply()
+        return {'FINISHED'}
 
 class DarrowCollapseOutliner(bpy.types.Operator):
     bl_label = "Collapse Outliner"
     bl_idname = "collapse.scene"
     bl_description = "Collapse all items in the outliner"
 
+    @profiled("collapse.scene")
     def execute(self, context):
         toggle_expand(context, 2)
         return {'FINISHED'}
@@ -781,6 +1734,8 @@ class DarrowWireframe(bpy.types.Operator):
     bl_description = "Display Wireframe Overlay Only"
     bl_label = "Toggle Wireframe"
 
+    @profiled("set.wireframe")
+    @batched_updates
     def execute(self, context):
         obj = context.active_object
         if bpy.context.scene.showWireframeBool == False:
@@ -812,12 +1767,16 @@ class DarrowSetCollectionCutter(bpy.types.Operator):
     bl_idname = "set.cutter_coll"
     bl_description = "Move all cutters to a collection"
     bl_label = "Group All cutters"
+    bl_options = {'REGISTER', 'UNDO'}
 
+    @profiled("set.cutter_coll")
+    @batched_updates
     def execute(self, context):
         collectionFound = False
         empty_collection_name = "_Cutters"
         old_obj = bpy.context.selected_objects
         scene = bpy.context.scene.objects
+        profiler.count(objects=len(scene))
 
         bpy.ops.object.select_all(action='DESELECT')
 
@@ -826,26 +1785,14 @@ class DarrowSetCollectionCutter(bpy.types.Operator):
                 collectionFound = True
                 break
 
-        bools = []
-        for obj in scene:
-            for mods in obj.modifiers:
-                if mods.type == 'BOOLEAN':
-                    bools.append(mods.object)
-        
-            if obj.display_type == 'BOUNDS':
-                bools.append(obj)
+        bools = list(cutter_index.scan(scene).cutters)
 
         if collectionFound == False and not len(bools) == 0:
             MakeCollections("_Cutters","COLOR_01", bpy.context.scene.cutterVis_Bool)
             
         if len(bools) != 0:
-            for obj in bools:
-                if obj is not None:
-                    for coll in obj.users_collection:
-                        coll.objects.unlink(obj)
-                    
-                    bpy.data.collections[empty_collection_name].objects.link(obj)
-            self.report({'INFO'}, "Moved all booleans")
+            moved, skipped = relink_objects(bools, bpy.data.collections[empty_collection_name], cutter_index.keep_collections())
+            self.report({'INFO'}, f"Moved {moved} cutters, {skipped} already sorted, used by {cutter_index.consumer_count()} meshes")
        
         bpy.ops.object.select_all(action='DESELECT')
 
@@ -858,12 +1805,16 @@ class DarrowSetCurveCollection(bpy.types.Operator):
     bl_idname = "set.curve_coll"
     bl_description = "Move all curves without volume to a collection"
     bl_label = "Group All Curves"
+    bl_options = {'REGISTER', 'UNDO'}
 
+    @profiled("set.curve_coll")
+    @batched_updates
     def execute(self, context):
         collectionFound = False
         empty_collection_name = "_Curves"
         old_obj = bpy.context.selected_objects
         scene = bpy.context.scene.objects
+        profiler.count(objects=len(scene))
         curves = []
 
         bpy.ops.object.select_all(action='DESELECT')
@@ -875,7 +1826,7 @@ class DarrowSetCurveCollection(bpy.types.Operator):
         for obj in scene:
             if obj.type == "CURVE":
                 if bpy.context.scene.volumeCurves_Bool == True:
-                    if curve_to_mesh(context, obj):
+                    if is_zero_volume_curve(context, obj):
                         curves.append(obj)
                 else:
                     curves.append(obj)
@@ -883,12 +1834,8 @@ class DarrowSetCurveCollection(bpy.types.Operator):
         if collectionFound == False and not len(curves) == 0:
             MakeCollections("_Curves","COLOR_07",context.scene.my_settings.curveVis)
         if len(curves) != 0:
-            for obj in curves:
-                if obj is not None:
-                    for coll in obj.users_collection:
-                        coll.objects.unlink(obj)
-                    bpy.data.collections[empty_collection_name].objects.link(obj)
-            self.report({'INFO'}, "Moved all curves")
+            moved, skipped = relink_objects(curves, bpy.data.collections[empty_collection_name])
+            self.report({'INFO'}, f"Moved {moved} curves, {skipped} already sorted")
     
         bpy.ops.object.select_all(action='DESELECT')
 
@@ -897,213 +1844,487 @@ class DarrowSetCurveCollection(bpy.types.Operator):
        
         return {'FINISHED'}
 
-class DarrowSetOverlap(bpy.types.Operator):
-    bl_idname = "set.overlap"
-    bl_description = "Move all overlapping objects. Generally helpful to sort LODs. This can be slow with large scenes. You can disable this from running in the 'Sort All' operation inside the 'Scene Organizer' panel settings"
-    bl_label = "Group All Overlapping Objects."
-    bl_options = {'UNDO'}
- 
-    def find_overlapping_objects(self, context):
-        def check_objs_overlap(obj_list):
+@profiled("find_origins")
+def find_origins(objects, grid):
+    matching_origins = dict()
+    seen = dict()
+    profiler.count(objects=len(objects))
+
+    for obj1 in objects:
+        origin1 = obj1.location
+        matching_origins[str(origin1)] = []
+        seen[str(origin1)] = set()
+
+    for index, obj1 in enumerate(objects):
+        key = str(obj1.location)
+
+        # Objects sharing a rounded origin share a key, so skip anything already added by them
+        for other in grid.neighbours(index):
+            if other not in seen[key]:
+                seen[key].add(other)
+                matching_origins[key].append(objects[other])
+
+    return matching_origins
+
+# Ungrouped objects whose candidate pairs are sent to the worker pool in one batch
+OVERLAP_PREFETCH_SEEDS = 256
+
+class VertexPairPrefetcher():
+    """Tests bounds matched pairs on worker threads, but only pairs the greedy grouping can still reach.
+
+    When the grouping loop asks for an untested pair, the next window of ungrouped objects is scanned and
+    every untested pair between two ungrouped objects goes to the pool in one batch. Pairs involving an
+    object that was grouped in the meantime are never tested. Sampled points are read through
+    geometry_cache on the main thread, since bpy data must not be touched from the workers"""
+
+    def __init__(self, objects, grid, bounds_pairs, all_bounds, grouped, tolerance, workers, pool):
+        self.objects = objects
+        self.grid = grid
+        self.bounds_pairs = bounds_pairs
+        self.all_bounds = all_bounds
+        self.order = list(all_bounds)
+        self.grouped = grouped
+        self.tolerance = tolerance
+        self.workers = workers
+        self.pool = pool
+        self.results = dict()
+
+    def overlaps(self, pair, position):
+        if pair not in self.results:
+            self.prefetch(position)
+        return self.results[pair]
+
+    def prefetch(self, position):
+        pending = []
+        queued = set()
+        for name in self.order[position:position + OVERLAP_PREFETCH_SEEDS]:
+            if name in self.grouped:
+                continue
+            index1 = self.all_bounds[name][0]
+            for index2 in self.grid.neighbours(index1):
+                pair = (min(index1, index2), max(index1, index2))
+                if pair in self.bounds_pairs and pair not in self.results and pair not in queued \
+                        and self.objects[index2].name not in self.grouped:
+                    queued.add(pair)
+                    pending.append(pair)
+
+        points = dict()
+        for pair in pending:
+            for index in pair:
+                if index not in points:
+                    points[index] = geometry_cache.get_entry(self.objects[index])["points"]
+
+        hits = evaluate_vertex_pairs(pending, points, self.tolerance, self.workers, self.pool)
+        self.results.update(zip(pending, hits))
+        profiler.count(objects=len(pending))
+
+@profiled("find_bounds_verts")
+def find_bounds_verts(origin_dict, objects, grid, bounds_tolerance, vertex_tolerance):
+
+    matching_bounds = dict()
+    all_bounds = dict()
+
+    object_index = {obj.name: index for index, obj in enumerate(objects)}
+
+    for key in origin_dict:
+
+        for obj in origin_dict[key]:
+            all_bounds[obj.name] = [object_index[obj.name], obj.location, obj]
+
+    # Every origin neighbour pair gets its bounds compared in one vectorized pass
+    world_bounds = snapshot_world_bounds(objects)
+    pairs = grid.pairs()
+    bounds_pairs = set(map(tuple, pairs[bounds_overlap(world_bounds, pairs, bounds_tolerance)].tolist()))
+
+    match = 0
+    geometry_cache.begin(bpy.context.scene.maxSearchVerts)
+    grouped_objects = {}  # To keep track of which objects are grouped together
+
+    # With several workers, vertex tests for the pairs still reachable run off the main thread in batches
+    workers = bpy.context.scene.overlapWorkers
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    prefetcher = None
+    if pool is not None:
+        prefetcher = VertexPairPrefetcher(objects, grid, bounds_pairs, all_bounds, grouped_objects, vertex_tolerance, workers, pool)
 
-            origin_tolerance = bpy.context.scene.originTolerance
-            bounds_tolerance = bpy.context.scene.boundsTolerance
-            vert_tolerance = bpy.context.scene.vertTolerance
+    try:
+        search_order = {name: order for order, name in enumerate(all_bounds)}
 
-            def find_origins(objects, tolerance):
-                matching_origins = dict()
+        for position, (name1, data1) in enumerate(all_bounds.items()):
 
-                for obj1 in objects:
-                    origin1 = obj1.location
-                    matching_origins[str(origin1)] = []
+            if name1 not in grouped_objects:
+                group = [name1]
+                shared_origin = data1[1]  # Origin of the first object in the group. Close enough to use as key for shared objects
 
-                for obj1 in objects:
-                    origin1 = obj1.location
+                # Only origin neighbours can match, visited in the same order as a full scan of all_bounds
+                candidates = sorted((objects[other].name for other in grid.neighbours(data1[0])), key=search_order.get)
 
-                    for obj2 in objects:
-                        if obj2 in matching_origins[str(origin1)]:
-                            continue
+                for name2 in candidates:
+                    if name2 not in grouped_objects:
+                        data2 = all_bounds[name2]
+                        index1, origin1, object1 = data1
+                        index2, origin2, object2 = data2
 
-                        if obj2 != obj1:
-                            origin2 = obj2.location
-                            distance = (origin1 - origin2).length
-                            if distance <= tolerance:
-                                matching_origins[str(origin1)].append(obj2)
+                        pair = (min(index1, index2), max(index1, index2))
+                        overlap = pair in bounds_pairs
 
-                return matching_origins
-            
-            def find_bounds_verts(origin_dict, origin_tolerance, bounds_tolerance, vertex_tolerance):
-
-                matching_bounds = dict()
-                all_bounds = dict()
-
-                for key in origin_dict:
-
-                    for obj in origin_dict[key]:
-
-                        name = obj.name
-                        bounds = obj.bound_box
-                        origin = obj.location
-                        object = obj
-                        matrix = [obj.matrix_world @ Vector(bound_vertex) for bound_vertex in bounds]
-                        all_bounds[name] = [matrix, origin, object]
-
-                match = 0
-                max_search_verts = bpy.context.scene.maxSearchVerts
-                grouped_objects = {}  # To keep track of which objects are grouped together
-
-                for name1, data1 in all_bounds.items():
-
-                    if name1 not in grouped_objects:
-                        group = [name1]
-                        shared_origin = data1[1]  # Origin of the first object in the group. Close enough to use as key for shared objects
-
-                        for name2, data2 in all_bounds.items():
-                            if name1 != name2 and name2 not in grouped_objects:
-                                bounds1, origin1, object1 = data1
-                                bounds2, origin2, object2 = data2
-                                object2 = data2[2]
-                                origin_distance = (origin1 - origin2).length
-
-                                if origin_distance <= origin_tolerance:
-                                    overlap = any(
-                                        all(
-                                            abs(v1 - v2) <= bounds_tolerance
-                                            for v1, v2 in zip(bound1, bound2)
-                                        )
-                                        for bound1, bound2 in zip(bounds1, bounds2)
-                                    )
-
-                                    if overlap:
-                                        vertices1 = [object1.matrix_world @ Vector(v.co) for v in object1.data.vertices[:max_search_verts]]
-                                        vertices2 = [object2.matrix_world @ Vector(v.co) for v in object2.data.vertices[:max_search_verts]]
-                                        vert_overlap = False
-                                        for v1 in vertices1:
-                                            for v2 in vertices2:
-                                                if (v1 - v2).length <= vertex_tolerance:
-                                                    vert_overlap = True
-                                                    break
-                                            if vert_overlap:
-                                                break
-
-                                    if overlap and vert_overlap:
-                                        group.append(name2)
-                                        grouped_objects[name2] = True
-                                        shared_origin = shared_origin
-
-                        if len(group) > 1:
-                            match += 1
-                            match_key = f"Match: {match} - Origin: {shared_origin}"
-                            matching_bounds[match_key] = group
-
-                return matching_bounds
-            
-            matching_origins = find_origins(obj_list, origin_tolerance)
-            matching_bounds = find_bounds_verts(matching_origins, origin_tolerance, bounds_tolerance, vert_tolerance)
+                        if overlap:
+                            if prefetcher is not None:
+                                vert_overlap = prefetcher.overlaps(pair, position)
+                            else:
+                                vert_overlap = geometry_cache.overlaps(object1, object2, vertex_tolerance)
 
-            return matching_bounds
+                        if overlap and vert_overlap:
+                            group.append(name2)
+                            grouped_objects[name2] = True
+                            shared_origin = shared_origin
 
-        def find_most_verts(overlapping_objs):
-            sortMethod = context.scene.overlapSortMethod
+                if len(group) > 1:
+                    match += 1
+                    match_key = f"Match: {match} - Origin: {shared_origin}"
+                    matching_bounds[match_key] = group
+    finally:
+        geometry_cache.end()
+        if pool is not None:
+            pool.shutdown()
 
-            for obj_name, matches in overlapping_objs.items():
-                object_with_highest_vertex_count = None
-                highest_vertex_count = 0
-                object_with_lowest_vertex_count = None
-                lowest_vertex_count = float('inf') 
+    return matching_bounds
 
-                for match_obj_name in matches:
-                    obj = bpy.data.objects[match_obj_name]
-                    vertex_count = len(obj.data.vertices)
+@profiled("check_objs_overlap")
+def check_objs_overlap(obj_list):
+    origin_tolerance = bpy.context.scene.originTolerance
+    bounds_tolerance = bpy.context.scene.boundsTolerance
+    vert_tolerance = bpy.context.scene.vertTolerance
 
-                    if sortMethod == "Highest":
-                        if vertex_count >= highest_vertex_count:
-                            highest_vertex_count = vertex_count
-                            object_with_highest_vertex_count = obj
+    grid = OriginGrid([obj.location for obj in obj_list], origin_tolerance)
+    matching_origins = find_origins(obj_list, grid)
+    matching_bounds = find_bounds_verts(matching_origins, obj_list, grid, bounds_tolerance, vert_tolerance)
 
-                    if sortMethod == "Lowest":
-                        if vertex_count <= lowest_vertex_count:
-                            lowest_vertex_count = vertex_count
-                            object_with_lowest_vertex_count = obj 
+    return matching_bounds
 
+@profiled("find_most_verts")
+def find_most_verts(context, overlapping_objs):
+    sortMethod = context.scene.overlapSortMethod
 
-                    overlapping_objs[obj_name] = [matches, object_with_highest_vertex_count, object_with_lowest_vertex_count]
+    for obj_name, matches in overlapping_objs.items():
+        object_with_highest_vertex_count = None
+        highest_vertex_count = 0
+        object_with_lowest_vertex_count = None
+        lowest_vertex_count = float('inf') 
 
-            return overlapping_objs
+        for match_obj_name in matches:
+            obj = bpy.data.objects[match_obj_name]
+            vertex_count = len(obj.data.vertices)
 
-        def move_to_collections(matches_dict):
-            overlap_collection_name = "_Overlapping"
-            collectionFound = False
-            for myCol in bpy.data.collections:
-                if myCol.name == overlap_collection_name:
-                    collectionFound = True
-                    break
+            if sortMethod == "Highest":
+                if vertex_count >= highest_vertex_count:
+                    highest_vertex_count = vertex_count
+                    object_with_highest_vertex_count = obj
 
-            if collectionFound == False and len(matches_dict) != 0:
-                MakeCollections(overlap_collection_name, "COLOR_06", context.scene.my_settings.overlapVis)
-    
-            # Create the parent overlapping collection if not found
-            if overlap_collection_name not in bpy.data.collections:
-                overlap_collection = bpy.data.collections.new(overlap_collection_name)
-                bpy.context.scene.collection.children.link(overlap_collection)
-            
-            bpy.ops.ed.undo_push()
-            
-            for match_key, data_list in matches_dict.items():
-                sortMethod = context.scene.overlapSortMethod
-                if sortMethod == "Highest":
-                    name = str(data_list[1].name)
-                            
-                if sortMethod == "Lowest":
-                    name = str(data_list[2].name)
-                       
-                child_collection_name = "Match: " +  name
-                if child_collection_name not in bpy.data.collections:
-                    child_collection = bpy.data.collections.new(child_collection_name)
-                    bpy.data.collections[child_collection_name].color_tag = 'COLOR_08'
-                    bpy.data.collections[overlap_collection_name].children.link(child_collection)
-                else:
-                    child_collection = bpy.data.collections[child_collection_name]
-               
-                objects_to_link = data_list[0]
-
-                for obj_name in objects_to_link:
-                    obj = bpy.data.objects.get(obj_name)
-                    if sortMethod == "Highest":
-                        if obj and obj != data_list[1]: #data_list[1] is highest vert count object
-                            for coll in obj.users_collection:
-                                coll.objects.unlink(obj)
-                            child_collection.objects.link(obj)
-                        else:
-                            if "Match:" in obj.users_collection[0].name:
-                                for coll in obj.users_collection:
-                                    coll.objects.unlink(obj)
-                                context.scene.collection.objects.link(obj)
-
-                    if sortMethod == "Lowest":
-                        if obj and obj != data_list[2]: #data_list[2] is lowest vert count object
-                            for coll in obj.users_collection:
-                                coll.objects.unlink(obj)
-                            child_collection.objects.link(obj)
-                        else:
-                            if "Match:" in obj.users_collection[0].name:
-                                for coll in obj.users_collection:
-                                    coll.objects.unlink(obj)
-                                context.scene.collection.objects.link(obj)
-
-            bpy.ops.ed.undo_push()
-            bpy.context.view_layer.update()
-
-        search_objects = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH' and obj.users_collection[0].name != "_Overlapping"]
+            if sortMethod == "Lowest":
+                if vertex_count <= lowest_vertex_count:
+                    lowest_vertex_count = vertex_count
+                    object_with_lowest_vertex_count = obj 
+
+
+            overlapping_objs[obj_name] = [matches, object_with_highest_vertex_count, object_with_lowest_vertex_count]
+
+    return overlapping_objs
+
+@profiled("move_to_collections")
+def move_to_collections(context, matches_dict):
+    """Links each match group into its "Match:" collection. Returns the number of objects moved"""
+    overlap_collection_name = "_Overlapping"
+    collectionFound = False
+    for myCol in bpy.data.collections:
+        if myCol.name == overlap_collection_name:
+            collectionFound = True
+            break
+
+    if collectionFound == False and len(matches_dict) != 0:
+        MakeCollections(overlap_collection_name, "COLOR_06", context.scene.my_settings.overlapVis)
+
+    # Create the parent overlapping collection if not found
+    if overlap_collection_name not in bpy.data.collections:
+        overlap_collection = bpy.data.collections.new(overlap_collection_name)
+        bpy.context.scene.collection.children.link(overlap_collection)
+        layer_collection_index.invalidate()
+
+    moved = 0
+    for match_key, data_list in matches_dict.items():
+        sortMethod = context.scene.overlapSortMethod
+        if sortMethod == "Highest":
+            name = str(data_list[1].name)
+
+        if sortMethod == "Lowest":
+            name = str(data_list[2].name)
+
+        child_collection_name = "Match: " +  name
+        if child_collection_name not in bpy.data.collections:
+            child_collection = bpy.data.collections.new(child_collection_name)
+            bpy.data.collections[child_collection_name].color_tag = 'COLOR_08'
+            bpy.data.collections[overlap_collection_name].children.link(child_collection)
+            layer_collection_index.invalidate()
+        else:
+            child_collection = bpy.data.collections[child_collection_name]
+
+        objects_to_link = data_list[0]
+        #data_list[1] is highest vert count object, data_list[2] is lowest vert count object
+        keep = data_list[1] if sortMethod == "Highest" else data_list[2]
+        matched = []
+
+        for obj_name in objects_to_link:
+            obj = bpy.data.objects.get(obj_name)
+            if obj and obj != keep:
+                matched.append(obj)
+            elif obj and "Match:" in obj.users_collection[0].name:
+                moved += relink_objects([obj], context.scene.collection)[0]
+
+        moved += relink_objects(matched, child_collection)[0]
+
+    deferred_updates.update(bpy.context.view_layer)
+    return moved
+
+def is_overlap_search_object(obj):
+    return obj.type == 'MESH' and obj.users_collection[0].name != "_Overlapping"
+
+def get_overlap_search_objects(context):
+    return [obj for obj in context.scene.objects if is_overlap_search_object(obj)]
+
+LIVE_OVERLAP_DELAY = 0.25
+
+class LiveOverlapTracker():
+    """Collects meshes moved or edited since the last live overlap pass, and keeps an origin grid over
+    the scene meshes between passes. Only the cells of dirty meshes are updated, the grid is built from
+    the whole scene on the first pass and again after undo, redo, loading or switching scenes"""
+
+    def __init__(self):
+        self.dirty = set()
+        self.busy = False
+        self.restored = False
+        self.reset()
+
+    def reset(self):
+        self.grid = None
+        self.scene = None
+        self.objects = []       # grid index -> object, None once removed
+        self.pointers = []      # grid index -> object pointer
+        self.index_of = dict()  # object pointer -> grid index
+
+    def build(self, context):
+        meshes = [obj for obj in context.scene.objects if obj.type == 'MESH']
+        self.grid = OriginGrid([obj.location for obj in meshes], context.scene.originTolerance)
+        self.scene = context.scene.as_pointer()
+        self.objects = meshes
+        self.pointers = [obj.as_pointer() for obj in meshes]
+        self.index_of = {pointer: index for index, pointer in enumerate(self.pointers)}
+        profiler.count(objects=len(meshes))
+
+    def remove(self, index):
+        self.index_of.pop(self.pointers[index], None)
+        self.grid.remove(index)
+        self.objects[index] = None
+
+    def sync(self, context, dirty_objects):
+        """Moves the dirty meshes to their current cells, adding and removing them as they enter or leave the scene"""
+        if self.grid is None or self.scene != context.scene.as_pointer() or self.grid.tolerance != context.scene.originTolerance:
+            self.build(context)
+            return
+
+        for obj in dirty_objects:
+            pointer = obj.as_pointer()
+            index = self.index_of.get(pointer)
+            in_scene = obj.type == 'MESH' and context.scene in obj.users_scene
+            if index is not None and in_scene:
+                self.grid.move(index, obj.location)
+                self.objects[index] = obj
+            elif index is not None:
+                self.remove(index)
+            elif in_scene:
+                self.index_of[pointer] = self.grid.add(obj.location)
+                self.objects.append(obj)
+                self.pointers.append(pointer)
+        profiler.count(objects=len(dirty_objects))
+
+    def neighbours(self, obj):
+        """Origin neighbours of obj still in the file, dropping any that were deleted since the last pass"""
+        index = self.index_of.get(obj.as_pointer())
+        if index is None:
+            return []
+
+        found = []
+        for other in self.grid.neighbours(index):
+            neighbour = self.objects[other]
+            try:
+                neighbour.name
+            except ReferenceError:
+                self.remove(other)
+                continue
+            found.append(neighbour)
+        return found
+
+    def order(self, obj):
+        """Grid index of obj, which follows scene order. None when obj is not in the grid"""
+        return self.index_of.get(obj.as_pointer())
+
+live_overlap = LiveOverlapTracker()
+
+def remove_empty_matches():
+    """Removes "Match:" collections left without members. Returns how many were removed"""
+    overlap_collection = bpy.data.collections.get("_Overlapping")
+    if overlap_collection is None:
+        return 0
+
+    removed = 0
+    for child in list(overlap_collection.children):
+        if child.name.startswith("Match: ") and len(child.objects) == 0 and len(child.children) == 0:
+            bpy.data.collections.remove(child)
+            layer_collection_index.invalidate()
+            removed += 1
+    return removed
+
+def old_group_members(obj):
+    """Names of every object sharing a "Match:" group with obj, whether obj was kept visible or matched"""
+    members = set()
+    for coll in obj.users_collection:
+        if coll.name.startswith("Match: "):
+            members.update(member.name for member in coll.objects)
+            # The kept object lends its name to the collection but is not linked into it
+            members.add(coll.name[len("Match: "):])
+    kept_collection = bpy.data.collections.get("Match: " + obj.name)
+    if kept_collection is not None:
+        members.update(member.name for member in kept_collection.objects)
+    members.discard(obj.name)
+    return members
+
+def push_undo_step(message):
+    """Pushes an undo step from a timer, borrowing the first window when the timer runs without one.
+    Returns False when there is no window to push from"""
+    if bpy.ops.ed.undo_push.poll():
+        bpy.ops.ed.undo_push(message=message)
+        return True
+
+    windows = bpy.context.window_manager.windows
+    if len(windows) == 0:
+        return False
+
+    window = windows[0]
+    if hasattr(bpy.context, "temp_override"):
+        with bpy.context.temp_override(window=window, screen=window.screen):
+            bpy.ops.ed.undo_push(message=message)
+    else:
+        bpy.ops.ed.undo_push({"window": window, "screen": window.screen}, message=message)
+    return True
+
+@profiled("update_live_overlap")
+def update_live_overlap():
+    """Re-sorts the dirty meshes together with everything that can change group with them: origin
+    neighbours and old group members, followed until no new object is reached. Grouping only ever
+    looks at origin neighbours, so this gives the same groups as a full pass over the scene.
+
+    A pass that relinks anything is pushed as its own undo step right after the edit that caused it,
+    so Ctrl+Z first takes back the regroup and then the edit. Passes that change nothing push no step
+    and leave the redo stack alone"""
+    context = bpy.context
+    dirty = live_overlap.dirty
+    live_overlap.dirty = set()
+
+    if not context.scene.liveOverlap_Bool:
+        return None
+
+    live_overlap.busy = True
+    try:
+        dirty_objects = [obj for obj in (bpy.data.objects.get(name) for name in dirty) if obj is not None]
+        live_overlap.sync(context, dirty_objects)
+
+        # Every reached object drags along its origin neighbours and the full old group of each of them
+        affected = dict()
+        pending = list(dirty_objects)
+        while pending:
+            obj = pending.pop()
+            if obj.name in affected:
+                continue
+            affected[obj.name] = obj
+
+            reached = [bpy.data.objects.get(name) for name in old_group_members(obj)]
+            reached.extend(live_overlap.neighbours(obj))
+            pending.extend(other for other in reached if other is not None and other.name not in affected)
+
+        # Kept in scene order, as far as the grid knows it, so groups come out like a full pass
+        subset = sorted((obj for obj in affected.values() if live_overlap.order(obj) is not None
+                         and is_overlap_search_object(obj)), key=live_overlap.order)
+        matches = find_most_verts(context, check_objs_overlap(subset))
+
+        grouped = set()
+        for data_list in matches.values():
+            grouped.update(data_list[0])
+
+        relinked = 0
+        for obj in subset:
+            if obj.name not in grouped and obj.users_collection[0].name.startswith("Match: "):
+                relinked += relink_objects([obj], context.scene.collection)[0]
+
+        with deferred_updates.deferred():
+            relinked += move_to_collections(context, matches)
+            relinked += remove_empty_matches()
+            # Evaluate our own relinks while still busy so they are not picked up as new edits
+            deferred_updates.update(context.view_layer)
+
+        if relinked:
+            push_undo_step("Live Overlap")
+    finally:
+        live_overlap.busy = False
+
+    return None
+
+@persistent
+def track_overlap_updates(scene, depsgraph):
+    # The first update after undo, redo or loading only re-evaluates restored data, nothing was edited
+    if live_overlap.restored:
+        live_overlap.restored = False
+        return
+
+    if live_overlap.busy or not scene.liveOverlap_Bool:
+        return
+
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object) and (update.is_updated_transform or update.is_updated_geometry):
+            obj = update.id.original
+            if obj.type == 'MESH':
+                live_overlap.dirty.add(obj.name)
+
+    if live_overlap.dirty and not bpy.app.timers.is_registered(update_live_overlap):
+        bpy.app.timers.register(update_live_overlap, first_interval=LIVE_OVERLAP_DELAY)
+
+@persistent
+def reset_live_overlap(dummy):
+    """Drops pending live overlap work on undo, redo and load, where it would regroup restored data"""
+    live_overlap.dirty = set()
+    live_overlap.reset()
+    live_overlap.restored = True
+    if bpy.app.timers.is_registered(update_live_overlap):
+        bpy.app.timers.unregister(update_live_overlap)
+
+class DarrowSetOverlap(bpy.types.Operator):
+    bl_idname = "set.overlap"
+    bl_description = "Move all overlapping objects. Generally helpful to sort LODs. This can be slow with large scenes. You can disable this from running in the 'Sort All' operation inside the 'Scene Organizer' panel settings"
+    bl_label = "Group All Overlapping Objects."
+    bl_options = {'UNDO'}
+ 
+    def find_overlapping_objects(self, context, search_objects=None):
+        if search_objects is None:
+            search_objects = get_overlap_search_objects(context)
 
         overlapping_objs = check_objs_overlap(search_objects)
-        highestLODs = find_most_verts(overlapping_objs)
-        move_to_collections(highestLODs)
+        highestLODs = find_most_verts(context, overlapping_objs)
+        move_to_collections(context, highestLODs)
 
         #print(highestLODs)
 
         return {'FINISHED'}
 
+    @profiled("set.overlap")
+    @batched_updates
     def execute(self, context):
         context = bpy.context
         start_time = time.perf_counter()
@@ -1123,12 +2344,16 @@ class DarrowSetCollection(bpy.types.Operator):
     bl_idname = "set.empty_coll"
     bl_description = "Move all empties to a collection"
     bl_label = "Group All Empties and Lattices"
+    bl_options = {'REGISTER', 'UNDO'}
 
+    @profiled("set.empty_coll")
+    @batched_updates
     def execute(self, context):
         collectionFound = False
         empty_collection_name = "_Empties"
         old_obj = bpy.context.selected_objects
         scene = bpy.context.scene.objects
+        profiler.count(objects=len(scene))
         empties = []
 
         bpy.ops.object.select_all(action='DESELECT')
@@ -1144,12 +2369,8 @@ class DarrowSetCollection(bpy.types.Operator):
         if collectionFound == False and not len(empties) == 0:
             MakeCollections("_Empties", "COLOR_03",context.scene.my_settings.emptiesVis)
         if len(empties) != 0:
-            for obj in empties:
-                if obj is not None:
-                    for coll in obj.users_collection:
-                        coll.objects.unlink(obj)
-                    bpy.data.collections[empty_collection_name].objects.link(obj)
-            self.report({'INFO'}, "Moved all empties")
+            moved, skipped = relink_objects(empties, bpy.data.collections[empty_collection_name])
+            self.report({'INFO'}, f"Moved {moved} empties, {skipped} already sorted")
     
         bpy.ops.object.select_all(action='DESELECT')
 
@@ -1162,12 +2383,16 @@ class DarrowSetArmsCollection(bpy.types.Operator):
     bl_idname = "set.arms_coll"
     bl_description = "Move all armatures to a collection"
     bl_label = "Group All Armatures"
+    bl_options = {'REGISTER', 'UNDO'}
 
+    @profiled("set.arms_coll")
+    @batched_updates
     def execute(self, context):
         collectionFound = False
         empty_collection_name = "_Armatures"
         old_obj = bpy.context.selected_objects
         scene = bpy.context.scene.objects
+        profiler.count(objects=len(scene))
         curves = []
 
         bpy.ops.object.select_all(action='DESELECT')
@@ -1184,12 +2409,8 @@ class DarrowSetArmsCollection(bpy.types.Operator):
             MakeCollections("_Armatures", "COLOR_04", context.scene.my_settings.armsVis)
         
         if len(curves) != 0:
-            for obj in curves:
-                if obj is not None:
-                    for coll in obj.users_collection:
-                        coll.objects.unlink(obj)
-                    bpy.data.collections[empty_collection_name].objects.link(obj)
-            self.report({'INFO'}, "Moved all armatures")
+            moved, skipped = relink_objects(curves, bpy.data.collections[empty_collection_name])
+            self.report({'INFO'}, f"Moved {moved} armatures, {skipped} already sorted")
     
         bpy.ops.object.select_all(action='DESELECT')
 
@@ -1198,18 +2419,103 @@ class DarrowSetArmsCollection(bpy.types.Operator):
 
         return {'FINISHED'}
 
+# Applied in this order, so an object matching several buckets ends up where the last set.* operator would put it
+SORT_BUCKETS = ("cutter", "curve", "empty", "armature")
+
+def sort_bucket_collections(context):
+    """Returns (collection name, color, visibility) for each sort bucket, matching the set.* operators"""
+    settings = context.scene.my_settings
+    return {
+        "cutter": ("_Cutters", "COLOR_01", context.scene.cutterVis_Bool),
+        "curve": ("_Curves", "COLOR_07", settings.curveVis),
+        "empty": ("_Empties", "COLOR_03", settings.emptiesVis),
+        "armature": ("_Armatures", "COLOR_04", settings.armsVis),
+    }
+
+@profiled("classify_scene_objects")
+def classify_scene_objects(context):
+    """Walks the scene objects and their modifiers once, bucketing everything "Sort All" will move.
+    Buckets hold the objects themselves, so linked objects sharing a local name stay apart"""
+    buckets = {bucket: [] for bucket in SORT_BUCKETS}
+    overlap_candidates = []
+    volume_check = context.scene.volumeCurves_Bool
+    scene_objects = context.scene.objects
+    profiler.count(objects=len(scene_objects))
+    cutter_index.clear()
+
+    for obj in scene_objects:
+        cutter_index.add(obj)
+
+        if obj.type == 'CURVE':
+            if volume_check == False or is_zero_volume_curve(context, obj):
+                buckets["curve"].append(obj)
+        elif obj.type == 'EMPTY' or obj.type == 'LATTICE':
+            buckets["empty"].append(obj)
+        elif obj.type == 'ARMATURE':
+            buckets["armature"].append(obj)
+        elif obj.type == 'MESH':
+            overlap_candidates.append(obj)
+
+    buckets["cutter"] = list(cutter_index.cutters)
+
+    # Keep only each object's final bucket
+    final = dict()
+    for bucket in SORT_BUCKETS:
+        for obj in buckets[bucket]:
+            final[obj] = bucket
+
+    classified = {bucket: [obj for obj in buckets[bucket] if final[obj] == bucket] for bucket in SORT_BUCKETS}
+    classified["overlap"] = overlap_candidates
+    return classified
+
+@profiled("move_sorted_objects")
+def move_sorted_objects(context, classified):
+    """Moves every bucketed object into its collection, creating the collections on first use.
+    Returns [moved, skipped] totals"""
+    collections = sort_bucket_collections(context)
+    totals = [0, 0]
+
+    for bucket in SORT_BUCKETS:
+        objects = classified[bucket]
+        if len(objects) == 0:
+            continue
+
+        collection_name, color, visible = collections[bucket]
+        if collection_name not in bpy.data.collections:
+            MakeCollections(collection_name, color, visible)
+        keep = cutter_index.keep_collections() if bucket == "cutter" else ()
+        moved, skipped = relink_objects(objects, bpy.data.collections[collection_name], keep)
+        totals[0] += moved
+        totals[1] += skipped
+
+    return totals
+
 class DarrowSetAllCollections(bpy.types.Operator):
     bl_idname = "set.all_coll"
     bl_description = "Sort all types and send to respective collections"
     bl_label = "Group All"
+    bl_options = {'REGISTER', 'UNDO'}
 
+    @profiled("set.all_coll")
+    @batched_updates
     def execute(self, context):
-        DarrowSetCollectionCutter.execute(self,context)
-        DarrowSetCurveCollection.execute(self,context)
-        DarrowSetCollection.execute(self,context)
-        DarrowSetArmsCollection.execute(self,context)
+        old_obj = bpy.context.selected_objects
+        bpy.ops.object.select_all(action='DESELECT')
+
+        classified = classify_scene_objects(context)
+        moved, skipped = move_sorted_objects(context, classified)
+
         if not bpy.context.scene.excludeOverlapSort:
-            DarrowSetOverlap.execute(self,context)
+            # Cutters just moved out of _Overlapping stay candidates, like in the sequential operators
+            search_objects = [obj for obj in classified["overlap"] if obj.users_collection[0].name != "_Overlapping"]
+            DarrowSetOverlap.find_overlapping_objects(DarrowSetOverlap, context, search_objects)
+
+        bpy.ops.object.select_all(action='DESELECT')
+
+        for x in old_obj:
+            x.select_set(state=True)
+
+        self.report({'INFO'}, f"Moved {moved} objects, {skipped} already sorted")
         return {'FINISHED'}
 
 class DARROW_MT_organizerPie(Menu):
@@ -1278,6 +2584,7 @@ class SceneOrganizerPopUpCallback(bpy.types.Operator):
     bl_label = "Scene Organizer Popup"
     bl_idname = "darrow.organizer_popup_callback"
 
+    @profiled("darrow.organizer_popup_callback")
     def execute(self, context):
         bpy.ops.wm.call_menu_pie(name="DARROW_MT_organizerPie")
         return {'FINISHED'}
@@ -1286,7 +2593,7 @@ def sceneDropdown(self, context):
     layout = self.layout
     layout.operator('darrow.organizer_popup_callback', icon="RESTRICT_VIEW_ON", text = "Scene Organizer")
 
-classes = (ORGANIZER_OT_Dummy,StoredPosition,ORGANIZER_OT_StorePosition,ORGANIZER_OT_RetrievePosition,
+classes = (ORGANIZER_OT_Dummy,StoredPosition,ORGANIZER_OT_ExportPerformance,ORGANIZER_OT_ClearPerformance,ORGANIZER_OT_StorePosition,ORGANIZER_OT_RetrievePosition,
             ORGANIZER_OT_AddPositionSlot,ORGANIZER_OT_RemovePositionSlot,
             DARROW_PT_organizePanel,OrganizerSettings,DarrowSort,
             DarrowRenameSelectedHigh,DarrowRenameSelectedLow,DarrowCleanName,DarrowToggleEmpty,DarrowSetCollectionCutter,
@@ -1306,6 +2613,17 @@ def register():
 
     bpy.types.VIEW3D_MT_object_context_menu.append(sceneDropdown)
     bpy.types.OUTLINER_HT_header.prepend(collapse_pop_up)
+    bpy.app.handlers.depsgraph_update_post.append(track_geometry_updates)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.append(clear_geometry_cache)
+    bpy.app.handlers.depsgraph_update_post.append(track_overlap_updates)
+    bpy.app.handlers.depsgraph_update_post.append(invalidate_layer_collections)
+    bpy.app.handlers.depsgraph_update_post.append(track_dependency_updates)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.append(clear_dependency_index)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.append(clear_visibility_state)
+        handlers.append(reset_live_overlap)
 
     bpy.types.Scene.my_settings = bpy.props.PointerProperty(type=OrganizerSettings)
 
@@ -1330,26 +2648,84 @@ def register():
         default=False
     )
 
+    bpy.types.Scene.toggleAllScenes_Bool = bpy.props.BoolProperty(
+        name="Toggle in All Scenes",
+        description="Apply visibility toggles to every view layer of every scene instead of only the active view layer",
+        default=False
+    )
+
+    bpy.types.Scene.outlinerSortMethod = bpy.props.EnumProperty(
+        description="How the Sort tool orders collections in the outliner",
+        default="Natural",
+        items=[
+            ('Natural', 'Natural Order', 'Alphabetical, with numbers in names compared by value'),
+            ('Name', 'Alphabetical', 'Plain alphabetical order'),
+            ('Color', 'Color Tag', 'Group by color tag, then natural order'),
+            ('Count', 'Object Count', 'Collections holding the most objects first, then natural order'),
+            ('Property', 'Custom Property', 'Order by the value of a custom property, then natural order'),
+        ],
+    )
+
+    bpy.types.Scene.outlinerSortProperty = bpy.props.StringProperty(
+        name="Sort Property",
+        description="Custom property to sort collections by",
+        default=""
+    )
+
+    bpy.types.Scene.sortObjects_Bool = bpy.props.BoolProperty(
+        name="Sort Objects",
+        description="Also sort the objects inside every collection, not only the collections themselves",
+        default=False
+    )
+
+    bpy.types.Scene.sortActiveScene_Bool = bpy.props.BoolProperty(
+        name="Sort Active Scene Only",
+        description="Only sort the outliner of the active scene instead of every scene in the file",
+        default=False
+    )
+
     bpy.types.Scene.maxSearchVerts = bpy.props.IntProperty(
         name="Max Vertex Search Count",
         description="Max vertices to search through in any given mesh when sorting by overlap",
         default=150,
-        max=1000,
+        soft_max=10000,
+        max=100000,
         min=0
     )
 
+    bpy.types.Scene.overlapWorkers = bpy.props.IntProperty(
+        name="Overlap Worker Threads",
+        description="Number of threads used to test overlap candidates. 1 runs the search on the main thread",
+        default=1,
+        soft_max=32,
+        max=256,
+        min=1
+    )
+
     bpy.types.Scene.excludeOverlapSort = bpy.props.BoolProperty(
         name="Exclude overlap",
         description="Exclude overlap from sorting",
         default=False
     )
 
+    bpy.types.Scene.liveOverlap_Bool = bpy.props.BoolProperty(
+        name="Live Overlap",
+        description="Re-sort overlapping objects as meshes are moved or edited, checking only the changed objects and their neighbours",
+        default=False
+    )
+
     bpy.types.Scene.volumeCurves_Bool = bpy.props.BoolProperty(
         name="Volume Curves",
         description="Only sort curves that have non-zero volume",
         default=True
     )
 
+    bpy.types.Scene.exactVolume_Bool = bpy.props.BoolProperty(
+        name="Exact Volume",
+        description="Always measure curve volume on a triangulated bmesh copy instead of the faster bounding box and signed volume checks",
+        default=False
+    )
+
     bpy.types.Scene.curveVis_Bool = bpy.props.BoolProperty(
         name="Vis Bool",
         description="Toggle visibility of curves",
@@ -1444,6 +2820,20 @@ def unregister():
 
     bpy.types.VIEW3D_MT_object_context_menu.remove(sceneDropdown)
     bpy.types.OUTLINER_HT_header.remove(collapse_pop_up)
+    bpy.app.handlers.depsgraph_update_post.remove(track_geometry_updates)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.remove(clear_geometry_cache)
+    bpy.app.handlers.depsgraph_update_post.remove(track_overlap_updates)
+    bpy.app.handlers.depsgraph_update_post.remove(invalidate_layer_collections)
+    bpy.app.handlers.depsgraph_update_post.remove(track_dependency_updates)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.remove(clear_dependency_index)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.remove(clear_visibility_state)
+        handlers.remove(reset_live_overlap)
+    if bpy.app.timers.is_registered(update_live_overlap):
+        bpy.app.timers.unregister(update_live_overlap)
+    geometry_cache.clear()
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
@@ -0,0 +1,253 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#   Copyright (C) 2022, 2023  Blake Darrow <contact@blakedarrow.com>
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# Pure math helpers for overlap searching. Nothing in here may import bpy, so
+# the module can be benchmarked and reused outside of Blender.
+
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil, dist, floor
+import numpy as np
+
+MIN_CELL_SIZE = 1e-6
+BOUNDS_BATCH_SIZE = 65536
+VERTEX_BATCH_SIZE = 262144
+SHARDS_PER_WORKER = 4
+
+def _cell(point, inv_size):
+    return (floor(point[0] * inv_size), floor(point[1] * inv_size), floor(point[2] * inv_size))
+
+class OriginGrid():
+    """Uniform hash grid over object origins, with cells sized to the search tolerance"""
+
+    def __init__(self, points, tolerance):
+        self.points = [tuple(p) for p in points]
+        self.tolerance = tolerance
+        # Pad the cell slightly so float rounding can never push a match two cells away
+        self.inv_size = 1.0 / (max(tolerance, MIN_CELL_SIZE) * (1.0 + 1e-6))
+        self.cells = dict()
+        self._neighbours = dict()
+
+        for index, point in enumerate(self.points):
+            self.cells.setdefault(_cell(point, self.inv_size), []).append(index)
+
+    def add(self, point):
+        """Adds a point and returns its index"""
+        index = len(self.points)
+        self.points.append(tuple(point))
+        self.cells.setdefault(_cell(self.points[index], self.inv_size), []).append(index)
+        self._neighbours.clear()
+        return index
+
+    def move(self, index, point):
+        """Moves a point, only touching the cell it leaves and the cell it enters"""
+        old_cell = _cell(self.points[index], self.inv_size)
+        self.points[index] = tuple(point)
+        new_cell = _cell(self.points[index], self.inv_size)
+        if new_cell != old_cell:
+            self._discard(old_cell, index)
+            self.cells.setdefault(new_cell, []).append(index)
+        self._neighbours.clear()
+
+    def remove(self, index):
+        """Takes a point out of the grid. Its index is never reused, so other indices stay valid"""
+        if self.points[index] is None:
+            return
+        self._discard(_cell(self.points[index], self.inv_size), index)
+        self.points[index] = None
+        self._neighbours.clear()
+
+    def _discard(self, cell, index):
+        members = self.cells[cell]
+        members.remove(index)
+        if len(members) == 0:
+            del self.cells[cell]
+
+    def neighbours(self, index):
+        """Returns the indices of every other point within tolerance, in ascending order"""
+        if index in self._neighbours:
+            return self._neighbours[index]
+
+        point = self.points[index]
+        cx, cy, cz = _cell(point, self.inv_size)
+        found = []
+
+        for x in (cx - 1, cx, cx + 1):
+            for y in (cy - 1, cy, cy + 1):
+                for z in (cz - 1, cz, cz + 1):
+                    for other in self.cells.get((x, y, z), ()):
+                        if other != index and dist(point, self.points[other]) <= self.tolerance:
+                            found.append(other)
+
+        found.sort()
+        self._neighbours[index] = found
+        return found
+
+    def pairs(self):
+        """Returns every neighbouring (i, j) pair with i < j as an (M, 2) array"""
+        pairs = [(index, other) for index in range(len(self.points)) if self.points[index] is not None
+                 for other in self.neighbours(index) if other > index]
+
+        return np.array(pairs, dtype=np.int64).reshape(-1, 2)
+
+def transform_bounds(matrices, corners):
+    """Applies (N, 4, 4) world matrices to (N, 8, 3) local bounding box corners"""
+    return np.einsum('nij,nkj->nki', matrices[:, :3, :3], corners) + matrices[:, None, :3, 3]
+
+def bounds_overlap(bounds, pairs, tolerance, batch_size=BOUNDS_BATCH_SIZE):
+    """Returns a mask over (M, 2) index pairs, True where any matching corner pair is within tolerance on every axis"""
+    result = np.zeros(len(pairs), dtype=bool)
+
+    for start in range(0, len(pairs), batch_size):
+        chunk = pairs[start:start + batch_size]
+        delta = np.abs(bounds[chunk[:, 0]] - bounds[chunk[:, 1]])
+        result[start:start + batch_size] = (delta <= tolerance).all(axis=2).any(axis=1)
+
+    return result
+
+# Cell keys are packed into one int64, larger grids fall back to the brute force sweep
+MAX_GRID_CELLS = 2 ** 62
+NEIGHBOUR_OFFSETS = np.array([(x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)], dtype=np.int64)
+
+def _within_bounds(points, other, tolerance):
+    """Points of one (N, 3) array inside the other's bounding box, padded by tolerance"""
+    return points[((points >= other.min(axis=0) - tolerance) & (points <= other.max(axis=0) + tolerance)).all(axis=1)]
+
+def brute_force_verts_overlap(points1, points2, tolerance, batch_size=VERTEX_BATCH_SIZE):
+    """Reference O(N * M) sweep over every point pair"""
+    if tolerance < 0 or len(points1) == 0 or len(points2) == 0:
+        return False
+
+    tolerance_sq = tolerance * tolerance
+    rows = max(1, batch_size // len(points2))
+
+    for start in range(0, len(points1), rows):
+        delta = points1[start:start + rows, None, :] - points2[None, :, :]
+        if ((delta * delta).sum(axis=2) <= tolerance_sq).any():
+            return True
+
+    return False
+
+def verts_overlap(points1, points2, tolerance, batch_size=VERTEX_BATCH_SIZE):
+    """True if any point of one (N, 3) array lies within tolerance of a point of the other.
+
+    The larger set is bucketed into a grid with cells the size of the tolerance and sorted by cell, so
+    every point of the smaller set only meets points in the 27 cells around it. The sorting and searching
+    all happen inside NumPy, which releases the GIL, so this also scales across worker threads"""
+    if tolerance < 0 or len(points1) == 0 or len(points2) == 0:
+        return False
+
+    # Only points inside the other set's padded bounding box can be close enough
+    points1 = _within_bounds(points1, points2, tolerance)
+    if len(points1) == 0:
+        return False
+    points2 = _within_bounds(points2, points1, tolerance)
+    if len(points2) == 0:
+        return False
+
+    if len(points1) > len(points2):
+        points1, points2 = points2, points1
+
+    inv_size = 1.0 / (max(tolerance, MIN_CELL_SIZE) * (1.0 + 1e-6))
+    cells1 = np.floor(points1 * inv_size).astype(np.int64)
+    cells2 = np.floor(points2 * inv_size).astype(np.int64)
+
+    # One cell of margin on every side, so neighbour offsets never wrap into another row
+    low = np.minimum(cells1.min(axis=0), cells2.min(axis=0)) - 1
+    dims = np.maximum(cells1.max(axis=0), cells2.max(axis=0)) - low + 2
+    if int(dims[0]) * int(dims[1]) * int(dims[2]) >= MAX_GRID_CELLS:
+        return brute_force_verts_overlap(points1, points2, tolerance, batch_size)
+
+    strides = np.array([dims[1] * dims[2], dims[2], 1], dtype=np.int64)
+    keys1 = (cells1 - low) @ strides
+    keys2 = (cells2 - low) @ strides
+
+    order = np.argsort(keys2, kind="stable")
+    sorted_keys = keys2[order]
+    sorted_points = points2[order]
+    tolerance_sq = tolerance * tolerance
+
+    for offset in NEIGHBOUR_OFFSETS @ strides:
+        query = keys1 + offset
+        starts = np.searchsorted(sorted_keys, query, side="left")
+        counts = np.searchsorted(sorted_keys, query, side="right") - starts
+        rows = np.nonzero(counts)[0]
+        if len(rows) == 0:
+            continue
+
+        # Expand each row into its run of candidates, in batches of roughly batch_size pairs
+        cumulative = np.cumsum(counts[rows])
+        first = 0
+        while first < len(rows):
+            done = cumulative[first - 1] if first else 0
+            last = max(int(np.searchsorted(cumulative, done + batch_size, side="right")), first + 1)
+            chunk = rows[first:last]
+            chunk_counts = counts[chunk]
+            total = int(chunk_counts.sum())
+
+            row_index = np.repeat(chunk, chunk_counts)
+            run_start = np.repeat(starts[chunk] - (np.cumsum(chunk_counts) - chunk_counts), chunk_counts)
+            candidates = run_start + np.arange(total)
+
+            delta = points1[row_index] - sorted_points[candidates]
+            if ((delta * delta).sum(axis=1) <= tolerance_sq).any():
+                return True
+            first = last
+
+    return False
+
+def _evaluate_shard(shard):
+    pairs, points, tolerance = shard
+    return [verts_overlap(points[i], points[j], tolerance) for i, j in pairs]
+
+def evaluate_vertex_pairs(pairs, points, tolerance, workers=1, pool=None):
+    """Runs verts_overlap over (i, j) pairs, sharded across a thread pool.
+
+    points maps each index to an (N, 3) array. Results come back in the order of pairs
+    regardless of the worker count, so callers can merge them deterministically. Pass an
+    existing ThreadPoolExecutor as pool to avoid starting threads on every call."""
+    pairs = list(pairs)
+    if workers <= 1 or len(pairs) < 2:
+        return _evaluate_shard((pairs, points, tolerance))
+
+    # NumPy releases the GIL inside the grid search, so threads avoid pickling every vertex array to a process
+    size = ceil(len(pairs) / (workers * SHARDS_PER_WORKER))
+    shards = [(pairs[start:start + size], points, tolerance) for start in range(0, len(pairs), size)]
+
+    results = []
+    if pool is not None:
+        for shard_result in pool.map(_evaluate_shard, shards):
+            results.extend(shard_result)
+        return results
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for shard_result in pool.map(_evaluate_shard, shards):
+            results.extend(shard_result)
+
+    return results
+
+def brute_force_neighbours(points, tolerance):
+    """Reference O(n^2) search, matching the original find_origins loop"""
+    points = [tuple(p) for p in points]
+    result = []
+
+    for index, point in enumerate(points):
+        result.append([other for other, point2 in enumerate(points)
+                       if other != index and dist(point, point2) <= tolerance])
+
+    return result
@@ -0,0 +1,118 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#   Copyright (C) 2022, 2023  Blake Darrow <contact@blakedarrow.com>
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# Lightweight stage timing for the organizer operators. Like overlap_index,
+# this module does not import bpy.
+
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+import json
+import time
+
+PROFILE_HISTORY = 64
+
+class StageRecord():
+    """Wall time and counters for one stage. Repeated child stages are merged by name.
+
+    bpy_calls counts the calls each stage actually made that write Blender data (links, unlinks,
+    visibility and selection writes, view layer updates) or read it in bulk (foreach_get, to_mesh)"""
+
+    __slots__ = ("name", "started", "duration", "objects", "bpy_calls", "calls", "children")
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.time()
+        self.duration = 0.0
+        self.objects = 0
+        self.bpy_calls = 0
+        self.calls = 1
+        self.children = dict()
+
+    def merge(self, other):
+        self.duration += other.duration
+        self.objects += other.objects
+        self.bpy_calls += other.bpy_calls
+        self.calls += other.calls
+        for child in other.children.values():
+            self.add_child(child)
+
+    def add_child(self, child):
+        if child.name in self.children:
+            self.children[child.name].merge(child)
+        else:
+            self.children[child.name] = child
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "started": self.started,
+            "duration": self.duration,
+            "objects": self.objects,
+            "bpy_calls": self.bpy_calls,
+            "calls": self.calls,
+            "children": [child.as_dict() for child in self.children.values()],
+        }
+
+class Profiler():
+    """Keeps the most recent top level stages in a ring buffer"""
+
+    def __init__(self, size=PROFILE_HISTORY):
+        self.records = deque(maxlen=size)
+        self.stack = []
+
+    @contextmanager
+    def stage(self, name):
+        record = StageRecord(name)
+        self.stack.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.duration = time.perf_counter() - start
+            self.stack.pop()
+            if self.stack:
+                self.stack[-1].add_child(record)
+            else:
+                self.records.append(record)
+
+    def count(self, objects=0, bpy_calls=0):
+        """Adds to the counters of every running stage, so parents include their children's work"""
+        for record in self.stack:
+            record.objects += objects
+            record.bpy_calls += bpy_calls
+
+    def clear(self):
+        self.records.clear()
+
+    def export(self, filepath):
+        with open(filepath, "w") as f:
+            json.dump([record.as_dict() for record in self.records], f, indent=2)
+
+profiler = Profiler()
+
+def profiled(name):
+    """Decorator running the wrapped function inside a profiler stage"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with profiler.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,123 @@
+# Headless benchmark for the curve zero-volume check. Builds bevelled and flat
+# curves at high resolution, then times the exact bmesh check against the tiered
+# hasVolume and confirms both agree:
+#
+#   blender -b --factory-startup --python benchmarks/curve_volume_benchmark.py -- \
+#       --curves 200 --points 64 --resolution 24 --output curve_volume.json
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import SceneOrganizer
+from SceneOrganizer import DarrowOrganizer
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Scene Organizer curve volume benchmark")
+    parser.add_argument("--curves", type=int, default=200, help="Number of curves to generate")
+    parser.add_argument("--points", type=int, default=64, help="Control points per spline")
+    parser.add_argument("--resolution", type=int, default=24, help="resolution_u and bevel_resolution of every curve")
+    parser.add_argument("--flat-ratio", type=float, default=0.5, help="Share of curves with extrude but no bevel")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="", help="JSON file to write, prints to stdout when empty")
+    return parser.parse_args(argv)
+
+def generate_curves(args):
+    rng = random.Random(args.seed)
+    scene = bpy.context.scene
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+
+    curves = []
+    for index in range(args.curves):
+        data = bpy.data.curves.new(f"bench_curve_{index}", 'CURVE')
+        data.dimensions = '3D'
+        data.resolution_u = args.resolution
+        data.bevel_resolution = args.resolution
+
+        if rng.random() < args.flat_ratio:
+            data.extrude = 0.1
+        else:
+            data.bevel_depth = 0.05
+
+        spline = data.splines.new('BEZIER')
+        spline.bezier_points.add(args.points - 1)
+        for i, point in enumerate(spline.bezier_points):
+            angle = i / args.points * math.tau
+            point.co = (math.cos(angle) * 2.0, math.sin(angle) * 2.0, rng.uniform(-0.5, 0.5))
+            point.handle_left_type = point.handle_right_type = 'AUTO'
+
+        obj = bpy.data.objects.new(data.name, data)
+        obj.location = (index % 20 * 5.0, index // 20 * 5.0, 0.0)
+        scene.collection.objects.link(obj)
+        curves.append(obj)
+
+    bpy.context.view_layer.update()
+    return curves
+
+def main():
+    args = parse_args()
+    DarrowOrganizer.register()
+    curves = generate_curves(args)
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    timings = {"bmesh": 0.0, "tiered": 0.0}
+    tiers = {"no_faces_or_flat": 0, "signed_volume": 0, "bmesh_fallback": 0}
+    mismatches = []
+    triangles = 0
+
+    for curve in curves:
+        curve_eval = curve.evaluated_get(depsgraph)
+        me = curve_eval.to_mesh()
+        me.calc_loop_triangles()
+        triangles += len(me.loop_triangles)
+
+        start = time.perf_counter()
+        exact = DarrowOrganizer.bmesh_has_volume(me, curve.matrix_world)
+        timings["bmesh"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        tiered = DarrowOrganizer.hasVolume(me, curve.matrix_world)
+        timings["tiered"] += time.perf_counter() - start
+
+        fast = DarrowOrganizer.fast_has_volume(me, curve.matrix_world)
+        if fast is None:
+            tiers["bmesh_fallback"] += 1
+        elif fast:
+            tiers["signed_volume"] += 1
+        else:
+            tiers["no_faces_or_flat"] += 1
+
+        if exact != tiered:
+            mismatches.append(curve.name)
+
+        curve_eval.to_mesh_clear()
+
+    results = {
+        "blender_version": bpy.app.version_string,
+        "addon_version": ".".join(str(v) for v in SceneOrganizer.bl_info["version"]),
+        "params": vars(args),
+        "triangles": triangles,
+        "timings": timings,
+        "speedup": timings["bmesh"] / timings["tiered"] if timings["tiered"] else None,
+        "tiers": tiers,
+        "mismatches": mismatches,
+    }
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Compares the origin hash grid used by "set.overlap" against the original
+# O(n^2) origin scan. Runs with plain Python, no Blender required:
+#
+#   python benchmarks/origin_index_benchmark.py
+#   python benchmarks/origin_index_benchmark.py --sizes 1000 10000 40000 --brute-limit 4000
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "SceneOrganizer"))
+
+from overlap_index import OriginGrid, brute_force_neighbours
+
+def make_origins(count, lod_levels, spread, jitter, seed):
+    """Scatter LOD stacks: groups of origins sharing a location up to jitter"""
+    rng = random.Random(seed)
+    points = []
+
+    while len(points) < count:
+        base = (rng.uniform(0, spread), rng.uniform(0, spread), rng.uniform(0, spread))
+        for i in range(lod_levels):
+            points.append(tuple(c + rng.uniform(-jitter, jitter) for c in base))
+
+    return points[:count]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 2000, 4000, 10000, 40000])
+    parser.add_argument("--tolerance", type=float, default=0.01)
+    parser.add_argument("--lods", type=int, default=3)
+    parser.add_argument("--jitter", type=float, default=0.002)
+    parser.add_argument("--brute-limit", type=int, default=4000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'objects':>8} {'grid (s)':>10} {'brute (s)':>10} {'speedup':>8}  identical")
+
+    for count in args.sizes:
+        # Keep the object density constant so the number of real neighbours stays comparable
+        points = make_origins(count, args.lods, spread=count ** (1 / 3), jitter=args.jitter, seed=args.seed)
+
+        start = time.perf_counter()
+        grid = OriginGrid(points, args.tolerance)
+        grid_result = [grid.neighbours(i) for i in range(len(points))]
+        grid_time = time.perf_counter() - start
+
+        if count <= args.brute_limit:
+            start = time.perf_counter()
+            brute_result = brute_force_neighbours(points, args.tolerance)
+            brute_time = time.perf_counter() - start
+            print(f"{count:>8} {grid_time:>10.4f} {brute_time:>10.4f} {brute_time / grid_time:>7.1f}x  {grid_result == brute_result}")
+        else:
+            print(f"{count:>8} {grid_time:>10.4f} {'-':>10} {'-':>8}  -")
+
+if __name__ == "__main__":
+    main()
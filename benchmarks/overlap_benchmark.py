@@ -0,0 +1,144 @@
+# Headless benchmark for the "set.overlap" search. Builds a synthetic scene of
+# LOD stacks, times each overlap stage separately and writes the results as JSON
+# so runs can be compared across versions:
+#
+#   blender -b --factory-startup --python benchmarks/overlap_benchmark.py -- \
+#       --stacks 2000 --lods 3 --verts 400 --jitter 0.002 --output overlap.json
+#
+# Pass several --workers values to compare thread counts on the same scene, e.g.
+# --verts 50000 --max-search-verts 50000 --workers 1 4 8
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import SceneOrganizer
+from SceneOrganizer import DarrowOrganizer
+from SceneOrganizer.overlap_index import OriginGrid
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Scene Organizer overlap benchmark")
+    parser.add_argument("--stacks", type=int, default=500, help="Number of LOD stacks to generate")
+    parser.add_argument("--lods", type=int, default=3, help="Objects per LOD stack")
+    parser.add_argument("--verts", type=int, default=400, help="Vertex count of LOD0, halved for every level")
+    parser.add_argument("--jitter", type=float, default=0.002, help="Random offset applied to each LOD origin")
+    parser.add_argument("--spacing", type=float, default=5.0, help="Distance between neighbouring stacks")
+    parser.add_argument("--singles", type=int, default=0, help="Extra meshes with no overlapping partner")
+    parser.add_argument("--repeat", type=int, default=2, help="Runs per benchmark, the first one with a cold geometry cache")
+    parser.add_argument("--max-search-verts", type=int, default=150)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1], help="Worker thread counts to run, each with a cold geometry cache")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="", help="JSON file to write, prints to stdout when empty")
+    return parser.parse_args(argv)
+
+def sphere_points(count, radius):
+    """Evenly spread points on a sphere, so every LOD level describes the same shape"""
+    points = []
+    golden = math.pi * (3.0 - math.sqrt(5.0))
+    for i in range(count):
+        y = 1.0 - (i / max(count - 1, 1)) * 2.0
+        ring = math.sqrt(max(0.0, 1.0 - y * y))
+        theta = golden * i
+        points.append((math.cos(theta) * ring * radius, y * radius, math.sin(theta) * ring * radius))
+    return points
+
+def generate_scene(args):
+    rng = random.Random(args.seed)
+    scene = bpy.context.scene
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+
+    meshes = dict()
+    def get_mesh(count):
+        if count not in meshes:
+            mesh = bpy.data.meshes.new(f"bench_sphere_{count}")
+            mesh.from_pydata(sphere_points(count, 1.0), [], [])
+            meshes[count] = mesh
+        return meshes[count]
+
+    side = max(1, math.ceil(math.sqrt(args.stacks + args.singles)))
+    slots = [(x * args.spacing, y * args.spacing, 0.0) for x in range(side) for y in range(side)]
+    rng.shuffle(slots)
+
+    for stack in range(args.stacks):
+        base = slots[stack]
+        for lod in range(args.lods):
+            obj = bpy.data.objects.new(f"stack_{stack}_LOD{lod}", get_mesh(max(4, args.verts >> lod)))
+            obj.location = [c + rng.uniform(-args.jitter, args.jitter) for c in base]
+            scene.collection.objects.link(obj)
+
+    for single in range(args.singles):
+        obj = bpy.data.objects.new(f"single_{single}", get_mesh(max(4, args.verts)))
+        obj.location = slots[args.stacks + single]
+        scene.collection.objects.link(obj)
+
+    bpy.context.view_layer.update()
+
+def timed(stages, name, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    stages[name] = time.perf_counter() - start
+    return result
+
+def run_once(context):
+    scene = context.scene
+    stages = dict()
+
+    objects = timed(stages, "search_objects", DarrowOrganizer.get_overlap_search_objects, context)
+    grid = timed(stages, "origin_grid", OriginGrid, [obj.location for obj in objects], scene.originTolerance)
+    origins = timed(stages, "find_origins", DarrowOrganizer.find_origins, objects, grid)
+    matches = timed(stages, "find_bounds_verts", DarrowOrganizer.find_bounds_verts,
+                    origins, objects, grid, scene.boundsTolerance, scene.vertTolerance)
+    matches = timed(stages, "find_most_verts", DarrowOrganizer.find_most_verts, context, matches)
+    timed(stages, "move_to_collections", DarrowOrganizer.move_to_collections, context, matches)
+
+    stages["total"] = sum(stages.values())
+    return {"objects": len(objects), "groups": len(matches), "stages": stages}
+
+def main():
+    args = parse_args()
+    DarrowOrganizer.register()
+
+    start = time.perf_counter()
+    generate_scene(args)
+    generate_time = time.perf_counter() - start
+
+    context = bpy.context
+    context.scene.maxSearchVerts = args.max_search_verts
+
+    runs = dict()
+    for workers in args.workers:
+        context.scene.overlapWorkers = workers
+        DarrowOrganizer.geometry_cache.clear()
+        runs[workers] = [run_once(context) for i in range(args.repeat)]
+
+    results = {
+        "blender_version": bpy.app.version_string,
+        "addon_version": ".".join(str(v) for v in SceneOrganizer.bl_info["version"]),
+        "params": vars(args),
+        "settings": {
+            "originTolerance": context.scene.originTolerance,
+            "boundsTolerance": context.scene.boundsTolerance,
+            "vertTolerance": context.scene.vertTolerance,
+        },
+        "generate_time": generate_time,
+        "runs": runs,
+    }
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Compares the grid based vertex overlap test used by "set.overlap" worker
+# threads against the brute force sweep it replaced, then times 1 against N
+# workers at high vertex counts. Runs with plain Python and NumPy, no Blender
+# required:
+#
+#   python benchmarks/vertex_overlap_benchmark.py
+#   python benchmarks/vertex_overlap_benchmark.py --verts 20000 100000 --pairs 32 --workers 1 4 8
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "SceneOrganizer"))
+
+from overlap_index import brute_force_verts_overlap, evaluate_vertex_pairs, verts_overlap
+
+def make_pairs(count, verts, offset, seed):
+    """Pairs of sphere shells, the second one pushed out by offset so most pairs do not overlap"""
+    rng = np.random.default_rng(seed)
+    points = dict()
+    pairs = []
+
+    for pair in range(count):
+        for side in range(2):
+            shell = rng.normal(size=(verts, 3))
+            shell /= np.linalg.norm(shell, axis=1)[:, None]
+            points[pair * 2 + side] = (shell * (1.0 + offset * side)).astype(np.float32)
+        pairs.append((pair * 2, pair * 2 + 1))
+
+    return pairs, points
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--verts", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--pairs", type=int, default=16, help="Mesh pairs tested per vertex count")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--tolerance", type=float, default=0.0001)
+    parser.add_argument("--offset", type=float, default=0.01, help="Gap between the two shells of a pair")
+    parser.add_argument("--brute-limit", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for verts in args.verts:
+        pairs, points = make_pairs(args.pairs, verts, args.offset, args.seed)
+        print(f"{verts} verts, {len(pairs)} pairs")
+
+        i, j = pairs[0]
+        start = time.perf_counter()
+        grid_result = verts_overlap(points[i], points[j], args.tolerance)
+        grid_time = time.perf_counter() - start
+        if verts <= args.brute_limit:
+            start = time.perf_counter()
+            brute_result = brute_force_verts_overlap(points[i], points[j], args.tolerance)
+            brute_time = time.perf_counter() - start
+            print(f"  one pair: grid {grid_time:.4f} s, brute {brute_time:.4f} s, identical {grid_result == brute_result}")
+        else:
+            print(f"  one pair: grid {grid_time:.4f} s, brute skipped")
+
+        baseline = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            results = evaluate_vertex_pairs(pairs, points, args.tolerance, workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"  {workers:>3} workers: {elapsed:.4f} s, {baseline / elapsed:.2f}x, {sum(results)} overlapping")
+
+if __name__ == "__main__":
+    main()
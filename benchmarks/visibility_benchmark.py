@@ -0,0 +1,138 @@
+# Headless benchmark for the visibility toggles. Builds a scene of sorted and
+# unsorted helpers, then times the previous double-write toggle against the
+# batched toggle operators, including the view layer update each one causes.
+# The set.* sorting operators are timed as well, with the number of view layer
+# updates each of them issued:
+#
+#   blender -b --factory-startup --python benchmarks/visibility_benchmark.py -- \
+#       --empties 10000 --stragglers 0.1 --output visibility.json
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import SceneOrganizer
+from SceneOrganizer import DarrowOrganizer
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Scene Organizer visibility toggle benchmark")
+    parser.add_argument("--empties", type=int, default=10000, help="Number of empties to generate")
+    parser.add_argument("--stragglers", type=float, default=0.1, help="Share of empties left outside _Empties")
+    parser.add_argument("--repeat", type=int, default=4, help="Toggles per method, alternating hide and show")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="", help="JSON file to write, prints to stdout when empty")
+    return parser.parse_args(argv)
+
+def generate_scene(args):
+    rng = random.Random(args.seed)
+    scene = bpy.context.scene
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+
+    organizer = bpy.data.collections.new("_SceneOrganizer")
+    scene.collection.children.link(organizer)
+    empties = bpy.data.collections.new("_Empties")
+    organizer.children.link(empties)
+
+    for index in range(args.empties):
+        obj = bpy.data.objects.new(f"bench_empty_{index}", None)
+        obj.location = (rng.uniform(-50, 50), rng.uniform(-50, 50), rng.uniform(-50, 50))
+        if rng.random() < args.stragglers:
+            scene.collection.objects.link(obj)
+        else:
+            empties.objects.link(obj)
+
+    bpy.context.view_layer.update()
+
+# The toggle as it shipped before batching, copied here so later changes to the add-on cannot speed up the baseline:
+# a recursive LayerCollection search per lookup, and every object written twice with its own update
+
+def legacy_get_layer_collection(collection):
+    def scan_children(lc, result=None):
+        for c in lc.children:
+            if c.collection == collection:
+                return c
+            result = scan_children(c, result)
+        return result
+
+    return scan_children(bpy.context.view_layer.layer_collection)
+
+def legacy_toggle_collection_vis(ob, collectionName, vis):
+    if str(ob.users_collection[0].name) == collectionName:
+        coll = legacy_get_layer_collection(bpy.data.collections[collectionName])
+        coll.hide_viewport = vis
+        coll.hide_viewport = not coll.hide_viewport
+        legacy_get_layer_collection(bpy.data.collections["_SceneOrganizer"]).hide_viewport = False
+
+    try:
+        ob.hide_set(vis)
+        ob.hide_set(not vis)
+    except RuntimeError:
+        pass
+
+def legacy_toggle(context, vis):
+    for ob in bpy.data.objects:
+        if ob.type == 'EMPTY' or ob.type == "LATTICE":
+            legacy_toggle_collection_vis(ob, "_Empties", vis)
+    context.view_layer.update()
+
+def batched_toggle(context, vis):
+    context.scene.emptyVis_Bool = not vis
+    bpy.ops.darrow.toggle_empty()
+
+def time_method(context, method, repeat):
+    timings = []
+    vis = context.scene.emptyVis_Bool
+    for i in range(repeat):
+        vis = not vis
+        start = time.perf_counter()
+        method(context, vis)
+        timings.append(time.perf_counter() - start)
+    return {"runs": timings, "mean": sum(timings) / len(timings)}
+
+def time_operators(names):
+    results = dict()
+    for name in names:
+        category, op_name = name.split(".")
+        operator = getattr(getattr(bpy.ops, category), op_name)
+        flushes = DarrowOrganizer.deferred_updates.flushes
+        start = time.perf_counter()
+        operator()
+        results[name] = {
+            "time": time.perf_counter() - start,
+            "view_layer_updates": DarrowOrganizer.deferred_updates.flushes - flushes,
+        }
+    return results
+
+def main():
+    args = parse_args()
+    DarrowOrganizer.register()
+    generate_scene(args)
+
+    context = bpy.context
+    results = {
+        "blender_version": bpy.app.version_string,
+        "addon_version": ".".join(str(v) for v in SceneOrganizer.bl_info["version"]),
+        "params": vars(args),
+        "before": time_method(context, legacy_toggle, args.repeat),
+        "after": time_method(context, batched_toggle, args.repeat),
+        "operators": time_operators(["set.empty_coll", "set.all_coll", "darrow.toggle_empty", "darrow.toggle_cutters"]),
+    }
+    results["speedup"] = results["before"]["mean"] / results["after"]["mean"] if results["after"]["mean"] else None
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
+
+if __name__ == "__main__":
+    main()